@@ -3,43 +3,64 @@
 Configuration loader for the benchmark.
 """
 
+import logging
+import mmap
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict
 
 import yaml
 
+import fast_json
 
-@dataclass
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+logger = logging.getLogger(__name__)
+
+_REQUIRED_KEYS = frozenset({"experiment_name", "input_dir", "loop", "evaluation"})
+
+
+@dataclass(slots=True, frozen=True)
 class _LoopConfig:
     type: str
     num_iterations: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _PromptsConfig:
     caption: str = "Describe this image in a single, descriptive sentence."
     image: str = "Generate a detailed image based on this text description."
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _LoggingConfig:
     level: str = "INFO"
     save_config_snapshot: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _EvaluationConfig:
     enabled: bool
+    batch_mode: bool = False
+    max_concurrency: int = 16
+    rpm: int = 0
+    cache: bool = True
+    pack_size: int = 1
+    max_image_side: int = 1024
+    model: str = "gemini-2.5-flash-lite"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _ReportingConfig:
     charts: bool = False
     summary: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BenchmarkConfig:
     """Configuration for the benchmark.
 
@@ -67,16 +88,25 @@ class BenchmarkConfig:
     def from_yaml(path: str) -> "BenchmarkConfig":
         """
         Load the YAML at `path`, merge with defaults, then return a BenchmarkConfig.
+
+        Files ending in ``.json`` skip the YAML parser and are read with the
+        (much faster) JSON loader instead.
         """
         if not os.path.exists(path):
             raise FileNotFoundError(f"Config file not found: {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
+        # Parsed configs are cached per file version; instances are frozen, so
+        # handing the same object to every caller is safe.
+        st = os.stat(path)
+        return _from_file_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
 
-        for key in ["experiment_name", "input_dir", "loop", "evaluation"]:
-            if key not in raw:
-                raise KeyError(f"Missing required key: '{key}'")
+    @staticmethod
+    def _from_file(path: str) -> "BenchmarkConfig":
+        raw = BenchmarkConfig._parse_file(path) or {}
+
+        missing = _REQUIRED_KEYS - raw.keys()
+        if missing:
+            raise KeyError(f"Missing required keys in config: {sorted(missing)}")
 
         exp_name = raw["experiment_name"]
         inp_dir = raw["input_dir"]
@@ -101,6 +131,19 @@ class BenchmarkConfig:
             reporting=rep_cfg,
         )
 
+    @staticmethod
+    def _parse_file(path: str) -> Any:
+        """Parse the config straight from a read-only memory map of the file."""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None  # mmap cannot map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if path.lower().endswith(".json"):
+                    with memoryview(mm) as buf:
+                        return fast_json.loads(buf)
+                _warn_if_slow_yaml_loader()
+                return yaml.load(mm, Loader=_SafeLoader)
+
     @staticmethod
     def _load_loop_config(loop_dict: Dict[str, Any]) -> _LoopConfig:
         num = loop_dict.get("num_iterations")
@@ -130,7 +173,37 @@ class BenchmarkConfig:
     def _load_evaluation_config(eval_dict: Dict[str, Any]) -> _EvaluationConfig:
         if "enabled" not in eval_dict:
             raise KeyError("evaluation.enabled is required")
-        return _EvaluationConfig(enabled=bool(eval_dict["enabled"]))
+        batch_mode = eval_dict.get("batch_mode", False)
+        if not isinstance(batch_mode, bool):
+            raise ValueError("evaluation.batch_mode must be true or false")
+        max_concurrency = eval_dict.get("max_concurrency", 16)
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise ValueError("evaluation.max_concurrency must be a positive integer")
+        cache = eval_dict.get("cache", True)
+        if not isinstance(cache, bool):
+            raise ValueError("evaluation.cache must be true or false")
+        rpm = eval_dict.get("rpm", 0)
+        if not isinstance(rpm, int) or rpm < 0:
+            raise ValueError("evaluation.rpm must be a non-negative integer")
+        pack_size = eval_dict.get("pack_size", 1)
+        if not isinstance(pack_size, int) or pack_size <= 0:
+            raise ValueError("evaluation.pack_size must be a positive integer")
+        max_image_side = eval_dict.get("max_image_side", 1024)
+        if not isinstance(max_image_side, int) or max_image_side <= 0:
+            raise ValueError("evaluation.max_image_side must be a positive integer")
+        model = eval_dict.get("model", "gemini-2.5-flash-lite")
+        if not isinstance(model, str) or not model:
+            raise ValueError("evaluation.model must be a non-empty string")
+        return _EvaluationConfig(
+            enabled=bool(eval_dict["enabled"]),
+            batch_mode=batch_mode,
+            max_concurrency=max_concurrency,
+            rpm=rpm,
+            cache=cache,
+            pack_size=pack_size,
+            max_image_side=max_image_side,
+            model=model,
+        )
 
     @staticmethod
     def _load_reporting_config(rep_dict: Dict[str, Any]) -> _ReportingConfig:
@@ -140,18 +213,38 @@ class BenchmarkConfig:
         )
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def _format_output_dir(template: str, exp_name: str) -> str:
-        single_brace = template.replace("{{", "{").replace("}}", "}")
-        try:
-            return single_brace.format(experiment_name=exp_name)
-        except KeyError as e:
-            # Unknown placeholder used in template
-            raise ValueError(
-                "Invalid output_dir template. Only '{experiment_name}' is supported. "
-                f"Got unknown key: {e} in template: {template!r}"
-            ) from e
-        except ValueError as e:
-            # Malformed braces or format string
+        # Pure function of two short strings, so results are memoised; a
+        # rejected template raises every time since exceptions are not cached.
+        out = template.replace("{{experiment_name}}", exp_name)
+        if "{" in out:
+            # Single-brace form is accepted too
+            out = out.replace("{experiment_name}", exp_name)
+        if "{" in out or "}" in out:
+            # Unknown placeholder or malformed braces
             raise ValueError(
-                f"Malformed output_dir template: {template!r}. Use 'results/{{experiment_name}}' or similar."
-            ) from e
+                f"Malformed output_dir template: {template!r}. "
+                "Only '{{experiment_name}}' is supported, e.g. 'results/{{experiment_name}}'."
+            )
+        return out
+
+
+@lru_cache(maxsize=32)
+def _from_file_cached(
+    path: str, mtime_ns: int, size: int  # pylint: disable=unused-argument
+) -> BenchmarkConfig:
+    """Parse ``path``; ``mtime_ns`` and ``size`` only key the cache."""
+    return BenchmarkConfig._from_file(path)
+
+
+@lru_cache(maxsize=None)
+def _warn_if_slow_yaml_loader() -> None:
+    """Warn once, on the first YAML parse, if libyaml is unavailable.
+
+    This runs at parse time rather than import time, so the message goes
+    through whatever logging setup is active by then. It is a warning so it
+    is shown even when no handler is configured.
+    """
+    if _SafeLoader is yaml.SafeLoader:
+        logger.warning("libyaml is not available; using the pure-Python YAML loader.")
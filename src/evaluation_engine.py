@@ -8,23 +8,35 @@ backend, and persists the results under each item's ``eval`` folder.
 
 from __future__ import annotations
 
+import io
 import json
 import os
+import random
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, cast
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple, TypeVar, cast
 
 from google import genai
+from google.genai import errors as genai_errors
 from google.genai import types
 from PIL import Image, UnidentifiedImageError
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationError
 
+import fast_json
 from benchmark_config import BenchmarkConfig
 from output_manager import OutputManager
+from rating_cache import RatingCache
 
 
 class _Criterion(BaseModel):
-    score: float
+    # The bounds are sent in the response schema, so the model is constrained
+    # to the rubric's 1.0-10.0 scale, and replies outside it fail validation.
+    score: float = Field(ge=1.0, le=10.0)
     reason: str
 
 
@@ -39,6 +51,7 @@ class _RatingModel(BaseModel):
 # The system instruction is stored in the prompts directory and loaded at runtime.
 # See prompts/system_instruction_eval.txt
 
+# Default rater model; override with ``evaluation.model``.
 MODEL_NAME = "gemini-2.5-flash-lite"
 
 Rating = Dict[str, Dict[str, Any]]
@@ -51,6 +64,248 @@ DEFAULT_RATING = {
     "overall_semantic_intent": {"score": -1.0, "reason": "Rating failed"},
 }
 
+# Comparison types, in the order their ratings files are written.
+_KINDS = ("image-image", "text-text", "image-text", "text-image")
+
+# Default longest image side sent to the rater, in pixels.
+_MAX_IMAGE_SIDE = 1024
+
+# File extensions the rater treats as images in cross-modal comparisons.
+_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png"})
+
+# Per-request timeout, so a stalled connection is retried instead of
+# holding a worker indefinitely.
+_REQUEST_TIMEOUT_MS = 120_000
+
+# 4xx responses worth retrying: request timeout and rate limiting.
+_RETRYABLE_CLIENT_CODES = frozenset({408, 429})
+
+# Longest server-requested wait honoured before a retry, in seconds.
+_MAX_RETRY_DELAY = 60.0
+
+# Seconds between status checks while a batch job runs.
+_BATCH_POLL_SECONDS = 30
+
+_BATCH_DONE_STATES = {
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+}
+
+
+# Comparisons made at every iteration, per loop type, as (kind, anchor, a, b)
+# in rating order. ``a`` and ``b`` name the inputs: base_* is the original,
+# curr_* this iteration's and prev_* the previous iteration's image or text.
+# "previous" rules are skipped for the first iteration.
+_PLAN_RULES: Dict[str, Tuple[Tuple[str, str, str, str], ...]] = {
+    "I-T-I": (
+        ("image-image", "original", "curr_img", "base_img"),
+        # image-text with original; no text-image with original in I-T-I
+        ("image-text", "original", "base_img", "curr_txt"),
+        ("image-image", "previous", "curr_img", "prev_img"),
+        ("text-text", "previous", "curr_txt", "prev_txt"),
+        ("image-text", "previous", "prev_img", "curr_txt"),
+        ("text-image", "previous", "prev_txt", "curr_img"),
+        ("image-text", "same-step", "curr_img", "curr_txt"),
+    ),
+    "T-I-T": (
+        ("text-text", "original", "curr_txt", "base_txt"),
+        # text-image with original; no image-image or image-text with original
+        ("text-image", "original", "base_txt", "curr_img"),
+        ("text-text", "previous", "curr_txt", "prev_txt"),
+        ("image-image", "previous", "curr_img", "prev_img"),
+        ("image-text", "previous", "curr_img", "prev_txt"),
+        ("text-image", "previous", "prev_txt", "curr_img"),
+        # No same-step image-text in T-I-T
+    ),
+}
+
+# Unknown loop type: compare cross-modal pairs in both directions, and keep
+# same-step image-text for backward compatibility.
+_DEFAULT_PLAN_RULES: Tuple[Tuple[str, str, str, str], ...] = (
+    ("image-text", "original", "base_img", "curr_txt"),
+    ("text-image", "original", "base_txt", "curr_img"),
+    ("image-image", "previous", "curr_img", "prev_img"),
+    ("text-text", "previous", "curr_txt", "prev_txt"),
+    ("image-text", "previous", "prev_img", "curr_txt"),
+    ("image-text", "previous", "curr_img", "prev_txt"),
+    ("text-image", "previous", "prev_txt", "curr_img"),
+    ("image-text", "same-step", "curr_img", "curr_txt"),
+)
+
+
+@dataclass(frozen=True)
+class _Comparison:
+    """One rating to obtain: ``a`` vs ``b`` as ``kind``, recorded at ``step``."""
+
+    kind: str
+    step: int
+    anchor: str
+    a: str
+    b: str
+
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class _Slot:
+    """Where a comparison's rating will appear: ``future.result()[pos]``."""
+
+    future: Optional["Future[List[Rating]]"] = None
+    pos: int = 0
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def rating(self) -> Rating:
+        return cast("Future[List[Rating]]", self.future).result()[self.pos]
+
+
+@lru_cache(maxsize=64)
+def _encode_image(
+    path: str,
+    mtime_ns: int,  # pylint: disable=unused-argument
+    size: int,  # pylint: disable=unused-argument
+    max_side: int = _MAX_IMAGE_SIDE,
+) -> bytes:
+    """Return JPEG bytes for ``path``; ``mtime_ns`` and ``size`` only key the cache.
+
+    Images are downscaled so the longest side is at most ``max_side``
+    (by default roughly the resolution the model works at) and re-encoded as
+    JPEG. An RGB JPEG that is already small enough is sent as-is.
+    """
+    with Image.open(path) as img:
+        if img.format == "JPEG" and img.mode == "RGB" and max(img.size) <= max_side:
+            return Path(path).read_bytes()
+        # RGB images are resized in place: no full-resolution copy is made,
+        # and thumbnail() can let the JPEG decoder skip detail it would
+        # discard anyway. Other modes are converted first because palette
+        # and bilevel images cannot be resampled smoothly.
+        rgb = img if img.mode == "RGB" else img.convert("RGB")
+        rgb.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        rgb.save(buf, "JPEG", quality=90)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=256)
+def _read_text_cached(
+    path: str, mtime_ns: int, size: int  # pylint: disable=unused-argument
+) -> str:
+    """Read and strip ``path``; ``mtime_ns`` and ``size`` only key the cache."""
+    return Path(path).read_text(encoding="utf-8").strip()
+
+
+@lru_cache(maxsize=None)
+def _load_prompts() -> Mapping[str, str]:
+    """Read every ``prompts/*.txt`` once per process, keyed by file stem.
+
+    The mapping is shared by all engines, so it is returned read-only.
+    """
+    prompts_dir = Path(__file__).parent.parent / "prompts"
+    return MappingProxyType(
+        {p.stem: p.read_text(encoding="utf-8") for p in prompts_dir.glob("*.txt")}
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_generation_config(
+    system_instruction: str, schema: Any
+) -> types.GenerateContentConfig:
+    """Build the request config once per instruction and schema.
+
+    Validating the config and converting ``schema`` is pydantic work that
+    would otherwise repeat on every rater call. The SDK only reads it.
+    """
+    return types.GenerateContentConfig(
+        system_instruction=system_instruction,
+        response_mime_type="application/json",
+        response_schema=schema,
+        http_options=types.HttpOptions(timeout=_REQUEST_TIMEOUT_MS),
+    )
+
+
+def _split_image_text(a: str, b: str) -> Tuple[str, str]:
+    """Return ``(image_path, text_path)`` for a cross-modal pair in either order."""
+    if os.path.splitext(a)[1].lower() in _IMAGE_EXTENSIONS:
+        return a, b
+    if os.path.splitext(b)[1].lower() in _IMAGE_EXTENSIONS:
+        return b, a
+    # Neither looks like an image; treat as missing image
+    raise FileNotFoundError(f"No image file provided for comparison of {a} and {b}")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed rater call might succeed if repeated.
+
+    Requests the API rejects outright (bad request, auth, unknown model) fail
+    the same way every time; rate limits, timeouts, server and network errors
+    are usually transient.
+    """
+    if isinstance(error, genai_errors.ClientError):
+        return error.code in _RETRYABLE_CLIENT_CODES
+    return True
+
+
+def _backoff(attempt: int) -> float:
+    """Seconds to wait before retrying after failed ``attempt`` (0-based).
+
+    The delay doubles per attempt (about 1s, 2s, 4s...) and is spread by up
+    to 50% either way, so concurrent workers that hit the same outage do not
+    all retry in lockstep.
+    """
+    return 2**attempt * random.uniform(0.5, 1.5)
+
+
+def _server_retry_delay(error: Exception) -> Optional[float]:
+    """Seconds the API asked us to wait before retrying ``error``, if it said.
+
+    Rate-limit (429) and overload (503) responses may carry a ``Retry-After``
+    header or a ``google.rpc.RetryInfo`` detail. Up to 20% is added at random
+    so workers given the same hint do not all retry at once, and the result
+    is capped at _MAX_RETRY_DELAY so a long quota window cannot stall a worker
+    for good.
+    """
+    if not isinstance(error, genai_errors.APIError) or error.code not in (429, 503):
+        return None
+    delay: Optional[float] = None
+    headers = getattr(error.response, "headers", None)
+    try:
+        if headers is not None and headers.get("retry-after"):
+            delay = float(headers.get("retry-after"))
+        else:
+            body = error.details if isinstance(error.details, dict) else {}
+            for detail in body.get("error", {}).get("details", []):
+                if str(detail.get("@type", "")).endswith("google.rpc.RetryInfo"):
+                    delay = float(str(detail["retryDelay"]).rstrip("s"))
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+    if delay is None or delay <= 0:
+        return None
+    return min(delay * random.uniform(1.0, 1.2), _MAX_RETRY_DELAY)
+
+
+class _RateLimiter:
+    """Space out call starts so at most ``rpm`` begin per minute (0: no limit)."""
+
+    def __init__(self, rpm: int) -> None:
+        self._interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
 
 class EvaluationEngine:
     """Evaluate semantic drift across loop iterations."""
@@ -63,43 +318,214 @@ class EvaluationEngine:
     ) -> None:
         self.exp_root = Path(exp_root)
         self.loop_type = config.loop.type.upper() if config else ""
+        self._plan_rules = _PLAN_RULES.get(self.loop_type, _DEFAULT_PLAN_RULES)
+        # The first iteration has no previous one; resolve that once here
+        # rather than per rule and iteration while planning.
+        self._first_step_rules = tuple(
+            rule for rule in self._plan_rules if rule[1] != "previous"
+        )
+        evaluation = config.evaluation
+        self.batch_mode = evaluation.batch_mode
+        self.max_concurrency = evaluation.max_concurrency
+        self.pack_size = evaluation.pack_size
+        self._limiter = _RateLimiter(evaluation.rpm)
+        self.model = evaluation.model
+        self.max_image_side = evaluation.max_image_side
         if client is not None:
             self.client = client
         else:
             api_key = os.getenv("GOOGLE_API_KEY")
             self.client = genai.Client(api_key=api_key) if api_key else None
-        self.prompts = self._load_prompts()
+        self.prompts = _load_prompts()
+        self._listings: Dict[str, Dict[str, Optional[os.stat_result]]] = {}
+        self._listings_lock = threading.Lock()
+        self._encodes: Dict[Tuple[str, int, int, int], "Future[bytes]"] = {}
+        self._encodes_lock = threading.Lock()
+        self.cache = (
+            RatingCache(self.exp_root / ".rater_cache", salt=self._cache_salt())
+            if evaluation.cache
+            else None
+        )
 
-    def _load_prompts(self) -> Dict[str, str]:
-        prompts_dir = Path(__file__).parent.parent / "prompts"
-        prompts = {}
-        for prompt_file in prompts_dir.glob("*.txt"):
-            with open(prompt_file, "r", encoding="utf-8") as f:
-                prompts[prompt_file.stem] = f.read()
-        return prompts
+    def _cache_salt(self) -> str:
+        """Everything besides the compared files that a rating depends on."""
+        salt: List[Any] = [self.model, sorted(self.prompts.items())]
+        # Only a non-default size is mixed in, so existing entries stay valid.
+        if self.max_image_side != _MAX_IMAGE_SIDE:
+            salt.append(self.max_image_side)
+        return json.dumps(salt)
 
     def run(self) -> None:
         """Run the evaluation process."""
         meta_path = self.exp_root / "metadata.json"
-        meta = json.load(open(meta_path, "r", encoding="utf-8"))
-        for item_id, record in meta.items():
-            self._eval_single_item(item_id, record)
+        meta = fast_json.loads(meta_path.read_bytes())
+        with self._listings_lock:
+            self._listings = {}  # Outputs may have changed since the last run
+        if self.batch_mode and self.client:
+            self._eval_batch(meta)
+            return
+
+        # Rater calls are network-bound and independent, so up to
+        # max_concurrency of them run at once, across items. Each comparison's
+        # inputs are hashed just before it is queued, so the pool is already
+        # rating while later ones are hashed, and at most a window of requests
+        # is queued ahead of the workers. An item's files are written as soon
+        # as all its ratings are in, whatever the items before it are doing,
+        # and its results are then dropped.
+        window = 2 * self.max_concurrency
+        first: Dict[str, _Slot] = {}
+        waiting: List[Tuple[str, List[_Comparison], List[_Slot]]] = []
+        running: Set["Future[List[Rating]]"] = set()
+
+        def write_finished() -> None:
+            nonlocal waiting
+            unfinished = []
+            for item_id, plan, slots in waiting:
+                if all(slot.done() for slot in slots):
+                    ratings = [slot.rating() for slot in slots]
+                    self._write_ratings(item_id, plan, ratings)
+                else:
+                    unfinished.append((item_id, plan, slots))
+            waiting = unfinished
+            # Successful ratings are in the rating cache by now, so later
+            # duplicates are answered from there; failed ones are retried.
+            for key in [key for key, slot in first.items() if slot.done()]:
+                del first[key]
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+
+            def submit(pack: List[Tuple[_Comparison, _Slot]]) -> None:
+                nonlocal running
+                future = pool.submit(self._rate_group, [comp for comp, _ in pack])
+                for pos, (_, slot) in enumerate(pack):
+                    slot.future, slot.pos = future, pos
+                running.add(future)
+                if len(running) >= window:
+                    _, running = wait(running, return_when=FIRST_COMPLETED)
+                    write_finished()
+
+            for item_id, record in meta.items():
+                plan = self._plan_comparisons(item_id, record)
+                slots: List[_Slot] = []
+                # Comparisons of one kind are packed up to pack_size per request.
+                packs: Dict[str, List[Tuple[_Comparison, _Slot]]] = {}
+                for comp in plan:
+                    new = _Slot()
+                    slot = self._dedupe(comp, first, new)
+                    slots.append(slot)
+                    if slot is not new:
+                        continue
+                    pack = packs.setdefault(comp.kind, [])
+                    pack.append((comp, slot))
+                    if len(pack) >= self.pack_size:
+                        submit(packs.pop(comp.kind))
+                for pack in packs.values():
+                    submit(pack)
+                waiting.append((item_id, plan, slots))
+                write_finished()
+            while running:
+                _, running = wait(running, return_when=FIRST_COMPLETED)
+                write_finished()
+
+    def _dedupe(self, comp: _Comparison, first: Dict[str, _T], new: _T) -> _T:
+        """Return what ``comp`` should reuse: ``new``, or an identical one's entry.
+
+        Comparisons whose inputs are byte-identical to an earlier one (an
+        iteration that reproduced the previous one exactly, say) would
+        otherwise be sent together, before either rating reached the cache.
+        ``first`` maps content keys to the entry of the first comparison seen
+        with them; ``new`` is recorded for ``comp`` if it is the first. Content
+        keys come from the rating cache, so nothing is merged when it is
+        disabled.
+        """
+        key = self._cache_key(comp)
+        if key is None:
+            return new
+        return first.setdefault(key, new)
+
+    def _rate_group(self, comps: List[_Comparison]) -> List[Rating]:
+        """Rate comparisons of one kind, packing cache misses into one request."""
+        if len(comps) == 1:
+            return [self._rate(comps[0])]
+        ratings: List[Optional[Rating]] = [None] * len(comps)
+        misses: List[int] = []
+        for j, comp in enumerate(comps):
+            key = self._cache_key(comp)
+            cached = self.cache.get(key) if key is not None else None
+            if cached is not None:
+                ratings[j] = cached
+            else:
+                misses.append(j)
 
-    def _eval_single_item(self, item_id: str, rec: Dict[str, str]) -> None:
-        om = OutputManager(self.exp_root / item_id / "eval")
-        # separate rating lists per comparison type
-        img_img_ratings: List[Dict[str, Any]] = []
-        txt_txt_ratings: List[Dict[str, Any]] = []
-        img_txt_ratings: List[Dict[str, Any]] = []
-        txt_img_ratings: List[Dict[str, Any]] = []
+        if len(misses) > 1:
+            self._limiter.wait()
+            packed = self._run_rater_packed(
+                comps[0].kind, [(comps[j].a, comps[j].b) for j in misses]
+            )
+            if packed is not None:
+                for j, rating in zip(misses, packed):
+                    ratings[j] = rating
+                    key = self._cache_key(comps[j])
+                    if key is not None:
+                        self.cache.put(key, rating)
+                misses = []
+
+        # Single comparisons, and packs the model did not answer in full, are
+        # rated one by one.
+        for j in misses:
+            ratings[j] = self._rate(comps[j])
+        return cast(List[Rating], ratings)
+
+    def _rate(self, comp: _Comparison) -> Rating:
+        key = self._cache_key(comp)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        self._limiter.wait()
+        rating = self._run_rater(comp.kind, comp.a, comp.b)
+        if key is not None and rating is not DEFAULT_RATING:
+            self.cache.put(key, rating)
+        return rating
+
+    def _cache_key(self, comp: _Comparison) -> Optional[str]:
+        # Without a client every rating is the DEFAULT_RATING placeholder,
+        # which is never worth caching.
+        if self.cache is None or not self.client:
+            return None
+        return self.cache.key(comp.kind, comp.a, comp.b)
+
+    def _eval_batch(self, meta: Dict[str, Dict[str, str]]) -> None:
+        """Plan every item up front and rate all comparisons in one batch job."""
+        plans = {
+            item_id: self._plan_comparisons(item_id, record)
+            for item_id, record in meta.items()
+        }
+        comps = [c for plan in plans.values() for c in plan]
+        first: Dict[str, int] = {}
+        source = [self._dedupe(comp, first, i) for i, comp in enumerate(comps)]
+        unique = [i for i, j in enumerate(source) if i == j]
+        rated = dict(zip(unique, self._rate_batch([comps[i] for i in unique])))
+        ratings = [rated[i] for i in source]
+        offset = 0
+        for item_id, plan in plans.items():
+            self._write_ratings(item_id, plan, ratings[offset : offset + len(plan)])
+            offset += len(plan)
+
+    def _plan_comparisons(self, item_id: str, rec: Dict[str, str]) -> List[_Comparison]:
+        """List the comparisons to rate for one item, in output order."""
 
         def _path(rel: str) -> str:
             return str(self.exp_root / item_id / rel)
 
-        iters = [
-            k.split("_")[0] for k in rec if k.startswith("iter") and k.endswith("_img")
-        ]
-        iters = sorted({int(idx.replace("iter", "")) for idx in iters})
+        # "iter12_img" -> 12, in one pass over the record's keys.
+        iters = sorted(
+            {
+                int(k[4 : k.index("_")])
+                for k in rec
+                if k.startswith("iter") and k.endswith("_img")
+            }
+        )
 
         start_with_image = "input.jpg" in rec or self.loop_type == "I-T-I"
         base_img = (
@@ -111,154 +537,121 @@ class EvaluationEngine:
             else _path(rec.get("iter1_text", ""))
         )
 
+        plan: List[_Comparison] = []
         for i in iters:
-            curr_img = _path(rec[f"iter{i}_img"])
-            curr_txt = _path(rec[f"iter{i}_text"])
-
-            # Compare with original (base) content
-            if self.loop_type == "I-T-I":
-                # For I-T-I: Always compare current image with original
-                img_img_ratings += self._compare_images(
-                    item_id, i, curr_img, base_img, "original"
-                )
-            elif self.loop_type == "T-I-T":
-                # For T-I-T: Always compare current text with original
-                txt_txt_ratings += self._compare_texts(
-                    item_id, i, curr_txt, base_txt, "original"
-                )
-
-            # Cross-modal comparison with original
-            if self.loop_type == "I-T-I":
-                # For I-T-I: image-text with original
-                img_txt_ratings += self._compare_cross(
-                    item_id, i, base_img, curr_txt, "original"
-                )
-                # text-image: not for original in I-T-I
-            elif self.loop_type == "T-I-T":
-                # For T-I-T: text-image with original
-                txt_img_ratings += self._compare_text_image(
-                    item_id, i, base_txt, curr_img, "original"
-                )
-            else:
-                # Unknown loop type: do both directions for original
-                img_txt_ratings += self._compare_cross(
-                    item_id, i, base_img, curr_txt, "original"
-                )
-                txt_img_ratings += self._compare_text_image(
-                    item_id, i, base_txt, curr_img, "original"
-                )
-
+            paths = {
+                "base_img": base_img,
+                "base_txt": base_txt,
+                "curr_img": _path(rec[f"iter{i}_img"]),
+                "curr_txt": _path(rec[f"iter{i}_text"]),
+            }
             # Compare with previous iteration (only for iterations after the first)
             if i > 1:
-                prev_img = _path(rec[f"iter{i - 1}_img"])
-                prev_txt = _path(rec[f"iter{i - 1}_text"])
-
-                if self.loop_type == "I-T-I":
-                    img_img_ratings += self._compare_images(
-                        item_id, i, curr_img, prev_img, "previous"
-                    )
-                    txt_txt_ratings += self._compare_texts(
-                        item_id, i, curr_txt, prev_txt, "previous"
-                    )
-                elif self.loop_type == "T-I-T":
-                    txt_txt_ratings += self._compare_texts(
-                        item_id, i, curr_txt, prev_txt, "previous"
-                    )
-                    img_img_ratings += self._compare_images(
-                        item_id, i, curr_img, prev_img, "previous"
-                    )
-                else:
-                    # If loop type unknown, do both comparisons
-                    img_img_ratings += self._compare_images(
-                        item_id, i, curr_img, prev_img, "previous"
-                    )
-                    txt_txt_ratings += self._compare_texts(
-                        item_id, i, curr_txt, prev_txt, "previous"
-                    )
-
-                # Cross-modal comparison with previous
-                if self.loop_type == "I-T-I":
-                    # For I-T-I: image-text (prev_img vs curr_txt) and text-image (prev_txt vs curr_img)
-                    img_txt_ratings += self._compare_cross(
-                        item_id, i, prev_img, curr_txt, "previous"
-                    )
-                    txt_img_ratings += self._compare_text_image(
-                        item_id, i, prev_txt, curr_img, "previous"
-                    )
-                elif self.loop_type == "T-I-T":
-                    # For T-I-T: image-text only for previous (curr_img vs prev_txt)
-                    img_txt_ratings += self._compare_cross(
-                        item_id, i, curr_img, prev_txt, "previous"
-                    )
-                    # And text-image also happens for previous
-                    txt_img_ratings += self._compare_text_image(
-                        item_id, i, prev_txt, curr_img, "previous"
-                    )
-                else:
-                    # Unknown loop type: do both directions for previous
-                    img_txt_ratings += self._compare_cross(
-                        item_id, i, prev_img, curr_txt, "previous"
-                    )
-                    img_txt_ratings += self._compare_cross(
-                        item_id, i, curr_img, prev_txt, "previous"
-                    )
-                    txt_img_ratings += self._compare_text_image(
-                        item_id, i, prev_txt, curr_img, "previous"
-                    )
+                paths["prev_img"] = _path(rec[f"iter{i - 1}_img"])
+                paths["prev_txt"] = _path(rec[f"iter{i - 1}_text"])
+            rules = self._plan_rules if i > 1 else self._first_step_rules
+            plan.extend(
+                _Comparison(kind, i, anchor, paths[a], paths[b])
+                for kind, anchor, a, b in rules
+            )
+        return plan
 
-            # Same-step cross-modal comparison
-            if self.loop_type == "I-T-I":
-                # Keep same-step image-text in I-T-I
-                img_txt_ratings += self._compare_cross(
-                    item_id, i, curr_img, curr_txt, "same-step"
-                )
-            elif self.loop_type == "T-I-T":
-                # In T-I-T, image-text happens only for previous per requirements
-                pass
-            else:
-                # Unknown loop type: keep same-step image-text for backward compatibility
-                img_txt_ratings += self._compare_cross(
-                    item_id, i, curr_img, curr_txt, "same-step"
+    def _write_ratings(
+        self, item_id: str, plan: List[_Comparison], ratings: List[Rating]
+    ) -> None:
+        """Write one ratings file per comparison type under the item's eval dir."""
+        om = OutputManager(self.exp_root / item_id / "eval")
+        by_kind: Dict[str, List[Dict[str, Any]]] = {kind: [] for kind in _KINDS}
+        for comp, rating in zip(plan, ratings):
+            by_kind[comp.kind].append(
+                self._package(
+                    comp.kind, item_id, comp.step, comp.anchor, rating, [comp.a, comp.b]
                 )
-
-        # write separate ratings files per comparison type
-        om.write_json(img_img_ratings, "ratings_image-image.json")
-        om.write_json(txt_txt_ratings, "ratings_text-text.json")
-        om.write_json(img_txt_ratings, "ratings_image-text.json")
-        om.write_json(txt_img_ratings, "ratings_text-image.json")
-
-    def _compare_images(
-        self, item: str, step: int, img_a: str, img_b: str, anchor: str
-    ) -> List[Dict[str, Any]]:
-        rating = self._run_rater("image-image", img_a, img_b)
-        return [
-            self._package("image-image", item, step, anchor, rating, [img_a, img_b])
-        ]
-
-    def _compare_texts(
-        self, item: str, step: int, txt_a: str, txt_b: str, anchor: str
-    ) -> List[Dict[str, Any]]:
-        rating = self._run_rater("text-text", txt_a, txt_b)
-        return [self._package("text-text", item, step, anchor, rating, [txt_a, txt_b])]
-
-    def _compare_cross(
-        self, item: str, step: int, img: str, txt: str, anchor: str
-    ) -> List[Dict[str, Any]]:
-        rating = self._run_rater("image-text", img, txt)
-        return [self._package("image-text", item, step, anchor, rating, [img, txt])]
-
-    def _compare_text_image(
-        self, item: str, step: int, txt: str, img: str, anchor: str
-    ) -> List[Dict[str, Any]]:
-        rating = self._run_rater("text-image", txt, img)
-        return [self._package("text-image", item, step, anchor, rating, [txt, img])]
+            )
+        for kind, records in by_kind.items():
+            om.write_json(records, f"ratings_{kind}.json")
+
+    def _listing(self, directory: str) -> Dict[str, Optional[os.stat_result]]:
+        """Stat every entry of ``directory`` with one scandir pass per run.
+
+        Each item's files are checked and stat'ed several times per
+        comparison; reading the directory once replaces those syscalls.
+        Dangling symlinks map to None.
+        """
+        with self._listings_lock:
+            listing = self._listings.get(directory)
+            if listing is None:
+                listing = {}
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            try:
+                                listing[entry.name] = entry.stat()
+                            except OSError:
+                                listing[entry.name] = None
+                except OSError:
+                    pass
+                self._listings[directory] = listing
+        return listing
+
+    def _lexists(self, path: str) -> bool:
+        """Like os.path.lexists, answered from the directory listing."""
+        directory, name = os.path.split(os.path.abspath(path))
+        return name in self._listing(directory)
+
+    def _stat(self, path: str) -> Optional[os.stat_result]:
+        """Stat ``path`` from the directory listing; None if it cannot be read."""
+        directory, name = os.path.split(os.path.abspath(path))
+        return self._listing(directory).get(name)
+
+    def _image_part(self, path: str) -> types.Part:
+        """Return the image at ``path`` as an upload-ready JPEG part.
+
+        The same images (the original input, the previous iteration) are
+        compared many times per item, so the encoded bytes are kept in a
+        small LRU cache.
+        """
+        st = self._stat(path)
+        if st is None:
+            raise FileNotFoundError(f"No such image file: {path}")
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size, self.max_image_side)
+        # Comparisons that share an image are submitted together, so several
+        # workers can miss the cache at once. Only the first encodes; the rest
+        # wait for its result. PIL releases the GIL while decoding, resizing
+        # and encoding, so different images still encode in parallel.
+        with self._encodes_lock:
+            pending = self._encodes.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._encodes[key] = Future()
+        if owner:
+            try:
+                pending.set_result(_encode_image(*key))
+            except BaseException as e:  # pylint: disable=broad-except
+                pending.set_exception(e)
+            finally:
+                with self._encodes_lock:
+                    del self._encodes[key]
+        data = pending.result()
+        return types.Part.from_bytes(data=data, mime_type="image/jpeg")
+
+    def _read_text(self, path: str) -> str:
+        """Return the stripped text at ``path``, or a placeholder if it is missing.
+
+        Captions are compared several times per item, so reads are memoised
+        per file version.
+        """
+        st = self._stat(path)
+        if st is None:
+            return "No text available"
+        return _read_text_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
 
     def _prepare_contents(self, kind: str, a: str, b: str) -> List[Any]:
         """Prepare the contents list for the Gemini API call based on comparison kind."""
         if kind == "image-image":
             # Accept symlinks as valid entries; we'll error clearly on open if target is missing.
             for p in (a, b):
-                if not (os.path.lexists(p) or Path(p).is_symlink() or Path(p).exists()):
+                if not self._lexists(p):
                     dir_p = os.path.dirname(os.path.abspath(p))
                     print(f"[DEBUG] Listing files in directory of {p}: {dir_p}")
                     try:
@@ -270,7 +663,7 @@ class EvaluationEngine:
                     )
                     raise FileNotFoundError(f"Missing image file entry: {p}")
             try:
-                img1 = Image.open(a)
+                img1 = self._image_part(a)
             except (FileNotFoundError, UnidentifiedImageError, OSError) as e:
                 target = None
                 if Path(a).is_symlink():
@@ -282,7 +675,7 @@ class EvaluationEngine:
                     f"Cannot open image A: {a}. Symlink target: {target}. Error: {e}"
                 ) from e
             try:
-                img2 = Image.open(b)
+                img2 = self._image_part(b)
             except (FileNotFoundError, UnidentifiedImageError, OSError) as e:
                 target = None
                 if Path(b).is_symlink():
@@ -293,44 +686,22 @@ class EvaluationEngine:
                 raise FileNotFoundError(
                     f"Cannot open image B: {b}. Symlink target: {target}. Error: {e}"
                 ) from e
-            if img1.mode != "RGB":
-                img1 = img1.convert("RGB")
-            if img2.mode != "RGB":
-                img2 = img2.convert("RGB")
             return [self.prompts["image_image_prompt"], img1, img2]
 
         if kind == "text-text":
-            text1 = (
-                Path(a).read_text(encoding="utf-8").strip()
-                if Path(a).exists()
-                else "No text available"
-            )
-            text2 = (
-                Path(b).read_text(encoding="utf-8").strip()
-                if Path(b).exists()
-                else "No text available"
-            )
+            text1 = self._read_text(a)
+            text2 = self._read_text(b)
             prompt_text = f"Compare these two texts:\nText 1: {text1}\nText 2: {text2}"
             return [self.prompts["text_text_prompt"], prompt_text]
 
         if kind == "image-text":
-            img_path, txt_path = (
-                (a, b) if a.lower().endswith((".jpg", ".jpeg", ".png")) else (b, a)
-            )
+            img_path, txt_path = _split_image_text(a, b)
             # Accept symlinked images; error clearly if they cannot be opened
-            if not (
-                os.path.lexists(img_path)
-                or Path(img_path).is_symlink()
-                or Path(img_path).exists()
-            ):
+            if not self._lexists(img_path):
                 raise FileNotFoundError(f"Missing image file entry: {img_path}")
-            text = (
-                Path(txt_path).read_text(encoding="utf-8").strip()
-                if Path(txt_path).exists()
-                else "No text available"
-            )
+            text = self._read_text(txt_path)
             try:
-                img = Image.open(img_path)
+                img = self._image_part(img_path)
             except (FileNotFoundError, UnidentifiedImageError, OSError) as e:
                 target = None
                 if Path(img_path).is_symlink():
@@ -341,37 +712,19 @@ class EvaluationEngine:
                 raise FileNotFoundError(
                     f"Cannot open image: {img_path}. Symlink target: {target}. Error: {e}"
                 ) from e
-            if img.mode != "RGB":
-                img = img.convert("RGB")
             return [self.prompts["image_text_prompt"], img, f"Text: {text}"]
 
         if kind == "text-image":
             # Determine which input is text and which is image regardless of order
-            if a.lower().endswith((".jpg", ".jpeg", ".png")):
-                img_path, txt_path = a, b
-            elif b.lower().endswith((".jpg", ".jpeg", ".png")):
-                img_path, txt_path = b, a
-            else:
-                # Neither looks like an image; treat as missing image
-                raise FileNotFoundError(
-                    "No image file provided for text-image comparison"
-                )
+            img_path, txt_path = _split_image_text(a, b)
 
             # Accept symlinked images; error clearly if they cannot be opened
-            if not (
-                os.path.lexists(img_path)
-                or Path(img_path).is_symlink()
-                or Path(img_path).exists()
-            ):
+            if not self._lexists(img_path):
                 raise FileNotFoundError(f"Missing image file entry: {img_path}")
 
-            text = (
-                Path(txt_path).read_text(encoding="utf-8").strip()
-                if Path(txt_path).exists()
-                else "No text available"
-            )
+            text = self._read_text(txt_path)
             try:
-                img = Image.open(img_path)
+                img = self._image_part(img_path)
             except (FileNotFoundError, UnidentifiedImageError, OSError) as e:
                 target = None
                 if Path(img_path).is_symlink():
@@ -382,8 +735,6 @@ class EvaluationEngine:
                 raise FileNotFoundError(
                     f"Cannot open image: {img_path}. Symlink target: {target}. Error: {e}"
                 ) from e
-            if img.mode != "RGB":
-                img = img.convert("RGB")
             # Reuse same prompt; order the modalities as text then image
             return [self.prompts["image_text_prompt"], f"Text: {text}", img]
 
@@ -398,25 +749,14 @@ class EvaluationEngine:
                 contents = self._prepare_contents(kind, a, b)
 
                 response = self.client.models.generate_content(
-                    model=MODEL_NAME,
-                    config=types.GenerateContentConfig(
-                        system_instruction=self.prompts.get(
-                            "system_instruction_eval", ""
-                        ),
-                        response_mime_type="application/json",
-                        response_schema=_RatingModel,
-                    ),
+                    model=self.model,
+                    config=self._generation_config(),
                     contents=contents,
                 )
 
-                if hasattr(response, "parsed") and response.parsed:
-                    parsed_data = response.parsed
-                    # We expect a _RatingModel, but cast to be safe
-                    rating_model = cast(_RatingModel, parsed_data)
-                    if hasattr(rating_model, "model_dump"):
-                        return rating_model.model_dump()
-                    if isinstance(rating_model, dict):
-                        return rating_model
+                rating = self._parsed_rating(response)
+                if rating is not None:
+                    return rating
 
                 # If we reach here, structured output failed.
                 print(
@@ -427,22 +767,175 @@ class EvaluationEngine:
 
                 # Only sleep if we're going to retry
                 if attempt < max_retries - 1:
-                    time.sleep(2**attempt)  # Exponential backoff: 1s, 2s, 4s...
+                    time.sleep(_backoff(attempt))
                     continue
 
             except Exception as e:  # pylint: disable=broad-except
                 print(
                     f"Error during {kind} comparison for '{a}' vs '{b}': {e} (Attempt {attempt + 1}/{max_retries})"
                 )
+                if not _is_retryable(e):
+                    break
 
                 # Only sleep if we're going to retry
                 if attempt < max_retries - 1:
-                    time.sleep(2**attempt)  # Exponential backoff: 1s, 2s, 4s...
+                    # Exponential backoff unless the API says how long to wait.
+                    time.sleep(_server_retry_delay(e) or _backoff(attempt))
                     continue
 
         # If all retries failed, return default rating
         return DEFAULT_RATING
 
+    def _generation_config(
+        self, schema: Any = _RatingModel
+    ) -> types.GenerateContentConfig:
+        return _build_generation_config(
+            self.prompts.get("system_instruction_eval", ""), schema
+        )
+
+    def _run_rater_packed(
+        self, kind: str, pairs: List[Tuple[str, str]]
+    ) -> Optional[List[Rating]]:
+        """Rate several same-kind pairs with one request.
+
+        The pairs share one copy of the instructions and come back as a JSON
+        array of ratings. Returns None, without retrying, when the request
+        fails or the array does not hold exactly one rating per pair; callers
+        then fall back to :meth:`_run_rater` for each pair.
+        """
+        if not self.client:
+            return None
+        try:
+            contents: List[Any] = []
+            for n, (a, b) in enumerate(pairs, start=1):
+                prompt, *parts = self._prepare_contents(kind, a, b)
+                contents += [f"PAIR {n}:", *parts]
+            contents.insert(
+                0,
+                f"{prompt}\n\nRate each of the {len(pairs)} pairs below "
+                "independently. Return a JSON array with exactly one rating "
+                "object per pair, in the order given.",
+            )
+            response = self.client.models.generate_content(
+                model=self.model,
+                config=self._generation_config(list[_RatingModel]),
+                contents=contents,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"Error during packed {kind} comparison of {len(pairs)} pairs: {e}")
+            return None
+
+        parsed = getattr(response, "parsed", None)
+        if not isinstance(parsed, list) or len(parsed) != len(pairs):
+            print(f"Error: Packed {kind} response did not rate all {len(pairs)} pairs")
+            return None
+        return [
+            item.model_dump() if hasattr(item, "model_dump") else item
+            for item in parsed
+        ]
+
+    @staticmethod
+    def _parsed_rating(response: Any) -> Optional[Rating]:
+        """Return the structured rating carried by ``response``, if any.
+
+        The SDK pre-parses ``response.parsed`` when the reply matches the
+        schema. Otherwise the raw ``response.text`` goes straight to
+        :meth:`_RatingModel.model_validate_json`, which parses and validates
+        in one pass; anything that is not a well-formed rating, malformed JSON
+        included, fails with a single ``ValidationError``.
+        """
+        if hasattr(response, "parsed") and response.parsed:
+            parsed_data = response.parsed
+            # We expect a _RatingModel, but cast to be safe
+            rating_model = cast(_RatingModel, parsed_data)
+            if hasattr(rating_model, "model_dump"):
+                return rating_model.model_dump()
+            if isinstance(rating_model, dict):
+                return rating_model
+        text = getattr(response, "text", None)
+        if isinstance(text, (str, bytes)) and text:
+            try:
+                return _RatingModel.model_validate_json(text).model_dump()
+            except ValidationError:
+                return None
+        return None
+
+    def _rate_batch(self, comparisons: List[_Comparison]) -> List[Rating]:
+        """Rate ``comparisons`` with one Gemini batch job, in order.
+
+        Batch jobs are billed at a discount and avoid one round trip per
+        comparison, at the cost of latency: results arrive when the whole job
+        finishes. Comparisons whose inputs cannot be loaded, or that the job
+        fails, get DEFAULT_RATING. If the job cannot be submitted at all the
+        comparisons are rated one by one instead.
+        """
+        ratings: List[Rating] = [DEFAULT_RATING] * len(comparisons)
+        keys = [self._cache_key(comp) for comp in comparisons]
+        requests: List[Dict[str, Any]] = []
+        slots: List[int] = []
+        for idx, comp in enumerate(comparisons):
+            cached = self.cache.get(keys[idx]) if keys[idx] is not None else None
+            if cached is not None:
+                ratings[idx] = cached
+                continue
+            try:
+                contents = self._prepare_contents(comp.kind, comp.a, comp.b)
+            except (FileNotFoundError, ValueError) as e:
+                print(
+                    f"Error during {comp.kind} comparison for '{comp.a}' vs '{comp.b}': {e}"
+                )
+                continue
+            requests.append({"contents": contents, "config": self._generation_config()})
+            slots.append(idx)
+        if not requests:
+            return ratings
+
+        try:
+            job = self.client.batches.create(
+                model=self.model,
+                src=requests,
+                config={"display_name": f"raa-eval-{self.exp_root.name}"},
+            )
+            print(
+                f"[INFO] Submitted batch job {job.name} with {len(requests)} requests"
+            )
+            while job.state not in _BATCH_DONE_STATES:
+                time.sleep(_BATCH_POLL_SECONDS)
+                job = self.client.batches.get(name=job.name)
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"Batch submission failed ({e}); rating comparisons one by one.")
+            for idx in slots:
+                ratings[idx] = self._rate(comparisons[idx])
+            return ratings
+
+        if job.state not in (
+            types.JobState.JOB_STATE_SUCCEEDED,
+            types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+        ):
+            print(f"Error: batch job {job.name} ended in state {job.state}")
+            return ratings
+
+        responses = (job.dest.inlined_responses if job.dest else None) or []
+        for idx, inlined in zip(slots, responses):
+            comp = comparisons[idx]
+            rating = self._batch_rating(inlined)
+            if rating is None:
+                print(
+                    f"Error: No valid structured output from Gemini batch for {comp.kind} {comp.a} vs {comp.b}"
+                )
+                continue
+            ratings[idx] = rating
+            if keys[idx] is not None:
+                self.cache.put(keys[idx], rating)
+        return ratings
+
+    @staticmethod
+    def _batch_rating(inlined: Any) -> Optional[Rating]:
+        """Parse one inlined batch response; batch results are not pre-parsed."""
+        if inlined.error or inlined.response is None:
+            return None
+        return EvaluationEngine._parsed_rating(inlined.response)
+
     def _package(
         self,
         typ: str,
@@ -452,7 +945,9 @@ class EvaluationEngine:
         rating: Rating,
         items: List[str],
     ) -> Dict[str, Any]:
-        rel_items = [Path(item).name for item in items]
+        # Planned paths are plain file paths, so basename matches Path.name
+        # without building a Path per operand.
+        rel_items = [os.path.basename(path) for path in items]
         return {
             "item_id": item,
             "step": step,
@@ -9,17 +9,19 @@ scores across generations, grouped by comparison type and anchor.
 
 from __future__ import annotations
 
-import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
-import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
 
-matplotlib.use("Agg")
+import fast_json
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 CRITERIA = [
     "content_correspondence",
@@ -33,6 +35,21 @@ ComparisonType = Literal["image-image", "text-text", "image-text", "text-image"]
 AnchorType = Literal["original", "previous", "same-step"]
 
 
+def _pyplot():
+    """Import pyplot on first use so importing this module stays cheap.
+
+    The headless Agg backend is selected before pyplot is imported so it never
+    probes for (or initialises) an interactive GUI toolkit.
+    """
+    # pylint: disable=import-outside-toplevel
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 @dataclass(frozen=True)
 class Key:
     """Represents a unique key for a specific evaluation scenario."""
@@ -42,6 +59,31 @@ class Key:
     direction: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class _RatingColumns:
+    """Rating records in column (struct-of-arrays) form.
+
+    Row ``i`` of every array describes the same record. Scores are NaN where
+    a criterion is missing, unparsable, or a negative placeholder. Each
+    (comparison_type, anchor) pair is stored once in ``groups``. Rows are
+    sorted by (group, step), so group ``g`` is the contiguous run
+    ``offsets[g]:offsets[g + 1]`` and selecting it is a slice.
+    """
+
+    steps: np.ndarray  # (n,) int64
+    groups: np.ndarray  # (g, 2) str, unique (comparison_type, anchor) pairs
+    offsets: np.ndarray  # (g + 1,) int, start row of each group, then n
+    scores: np.ndarray  # (n, len(CRITERIA)) float64
+    scored: np.ndarray  # (n,) bool, row has at least one score
+
+    def group_code(self, comparison_type: str, anchor: str) -> int:
+        """Return the code for a (comparison_type, anchor) pair, or -1."""
+        hits = np.flatnonzero(
+            (self.groups[:, 0] == comparison_type) & (self.groups[:, 1] == anchor)
+        )
+        return int(hits[0]) if hits.size else -1
+
+
 class GraphCreator:
     """Class responsible for creating evaluation charts from rating data."""
 
@@ -71,16 +113,11 @@ class GraphCreator:
         if not records:
             return charts
         item_id = self._extract_item_id(eval_dir, records)
+        columns = self._to_columns(records)
 
         # Auto-detect loop type from available data
-        has_imgimg_orig = any(
-            r.get("comparison_type") == "image-image" and r.get("anchor") == "original"
-            for r in records
-        )
-        has_txttxt_orig = any(
-            r.get("comparison_type") == "text-text" and r.get("anchor") == "original"
-            for r in records
-        )
+        has_imgimg_orig = columns.group_code("image-image", "original") >= 0
+        has_txttxt_orig = columns.group_code("text-text", "original") >= 0
         if has_imgimg_orig and not has_txttxt_orig:
             loop_type = "I-T-I"
         elif has_txttxt_orig and not has_imgimg_orig:
@@ -92,13 +129,20 @@ class GraphCreator:
         wanted_keys = self._get_wanted_keys(loop_type)
 
         missing = []
-        for key in wanted_keys:
-            series = list(self._iter_series(records, key))
-            if not series:
-                missing.append(key)
-            out = self._plot_group(item_id, eval_dir, key, series)
-            if out:
-                charts.append(out)
+        # One figure is reused for every chart of this item; each chart clears
+        # the axes instead of allocating a new figure.
+        plt = _pyplot()
+        fig, ax = plt.subplots(figsize=(9.5, 5.5), dpi=140)
+        try:
+            for key in wanted_keys:
+                steps, scores = self._select_series(columns, key)
+                if not steps.size:
+                    missing.append(key)
+                out = self._plot_group(item_id, eval_dir, key, steps, scores, ax=ax)
+                if out:
+                    charts.append(out)
+        finally:
+            plt.close(fig)
 
         if missing:
             print(f"[reporting] Loop type detected: {loop_type}")
@@ -112,18 +156,26 @@ class GraphCreator:
                 "charts": [str(p.name) for p in charts],
             }
             try:
-                with (eval_dir / "charts_index.json").open("w", encoding="utf-8") as f:
-                    json.dump(index, f, indent=2)
+                (eval_dir / "charts_index.json").write_bytes(
+                    fast_json.dumps(index, indent=True)
+                )
             except (OSError, IOError) as e:
                 print(f"[reporting] Failed to write charts_index.json: {e}")
 
         return charts
 
-    def generate_charts_for_experiment(self, root: Path) -> List[Path]:
+    def generate_charts_for_experiment(
+        self, root: Path, max_workers: Optional[int] = 1
+    ) -> List[Path]:
         """Generate charts for all evaluation directories found under the given root path.
 
         Args:
             root (Path): The root path to search for evaluation directories.
+            max_workers (Optional[int]): Most processes used to render items
+                in parallel; ``None`` allows one per CPU core. Each worker
+                re-imports matplotlib, so no more are started than there are
+                items or cores, and a single item, like ``1``, is rendered
+                serially in the current process.
 
         Returns:
             List[Path]: A list of paths to all generated chart images.
@@ -132,9 +184,17 @@ class GraphCreator:
         if not eval_dirs:
             return []
 
+        workers = min(
+            len(eval_dirs), max_workers or len(eval_dirs), os.cpu_count() or 1
+        )
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                results = list(ex.map(self.generate_charts_for_eval, eval_dirs))
+        else:
+            results = map(self.generate_charts_for_eval, eval_dirs)
+
         all_charts: List[Path] = []
-        for eval_dir in eval_dirs:
-            charts = self.generate_charts_for_eval(eval_dir)
+        for eval_dir, charts in zip(eval_dirs, results):
             all_charts.extend(charts)
             print(f"Generated {len(charts)} charts -> {eval_dir}")
 
@@ -193,9 +253,8 @@ class GraphCreator:
         records: List[Dict[str, Any]] = []
         for fp in self._collect_eval_files(eval_dir):
             try:
-                with fp.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except json.JSONDecodeError as e:
+                data = fast_json.loads(fp.read_bytes())
+            except fast_json.JSONDecodeError as e:
                 print(f"[reporting] Failed to decode JSON in {fp}: {e}")
                 continue
             except OSError as e:
@@ -218,19 +277,12 @@ class GraphCreator:
         parent = eval_dir.parent.name
         return parent or "item"
 
-    def _iter_series(
-        self, records: List[Dict[str, Any]], wanted: Key
-    ) -> Iterable[Tuple[int, Dict[str, Optional[float]]]]:
-        """Yield (step, scores_by_criteria) for a given grouping key.
-
-        Only returns steps where at least one criterion has a non-null score.
-        """
+    def _to_columns(self, records: List[Dict[str, Any]]) -> _RatingColumns:
+        """Convert records to columns once so grouping is array masking."""
+        steps: List[int] = []
+        group_keys: List[Tuple[str, str]] = []
+        kept: List[Dict[str, Any]] = []
         for rec in records:
-            ctype = rec.get("comparison_type")
-            anchor = rec.get("anchor")
-            if ctype != wanted.comparison_type or anchor != wanted.anchor:
-                continue
-
             step_val = rec.get("step")
             if step_val is None:
                 continue
@@ -242,92 +294,149 @@ class GraphCreator:
                 )
                 continue  # Skip this record if step cannot be parsed
 
-            scores: Dict[str, Optional[float]] = {}
-            has_any = False
-            for crit in self.criteria:
-                val = rec.get(crit)
-                score: Optional[float] = None
-                if isinstance(val, dict) and "score" in val:
-                    try:
-                        score = float(val["score"])
-                    except (ValueError, TypeError):
-                        print("[reporting] failed to assign score.")
-                        score = None
-                # Filter out placeholders like -1.0 if present
-                if score is not None and score < 0:
-                    score = None
-                if score is not None:
-                    has_any = True
-                scores[crit] = score
-            if has_any:
-                yield step, scores
+            steps.append(step)
+            group_keys.append((str(rec.get("comparison_type")), str(rec.get("anchor"))))
+            kept.append(rec)
+
+        # Fill each criterion column straight from the records: np.fromiter
+        # writes into the float64 buffer without building per-row lists.
+        n = len(kept)
+        scores = np.empty((n, len(self.criteria)), dtype=np.float64)
+        for col, crit in enumerate(self.criteria):
+            scores[:, col] = np.fromiter(
+                (self._parse_score(rec.get(crit)) for rec in kept),
+                dtype=np.float64,
+                count=n,
+            )
+
+        groups, group_codes = np.unique(
+            np.array(group_keys, dtype=str).reshape(-1, 2),
+            axis=0,
+            return_inverse=True,
+        )
+        group_codes = group_codes.reshape(-1)
+        step_arr = np.fromiter(steps, dtype=np.int64, count=n)
+
+        # One stable sort by (group, step); records sharing a step keep their
+        # file order, and each group becomes a contiguous run of rows.
+        order = np.lexsort((step_arr, group_codes))
+        sorted_codes = group_codes[order]
+        offsets = np.concatenate(
+            ([0], np.flatnonzero(np.diff(sorted_codes)) + 1, [n])
+        ).astype(np.intp)
+        scores = scores[order]
+        return _RatingColumns(
+            steps=step_arr[order],
+            groups=groups,
+            offsets=offsets,
+            scores=scores,
+            scored=~np.isnan(scores).all(axis=1),
+        )
+
+    @staticmethod
+    def _parse_score(val: Any) -> float:
+        """Return the criterion score, or NaN for missing/invalid/placeholder."""
+        if not isinstance(val, dict) or "score" not in val:
+            return np.nan
+        try:
+            score = float(val["score"])
+        except (ValueError, TypeError):
+            print("[reporting] failed to assign score.")
+            return np.nan
+        # Filter out placeholders like -1.0 if present
+        return score if score >= 0 else np.nan
+
+    @staticmethod
+    def _select_series(
+        columns: _RatingColumns, wanted: Key
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (steps, scores) for a grouping key, ordered by step.
+
+        Only keeps rows where at least one criterion has a score.
+        """
+        code = columns.group_code(wanted.comparison_type, wanted.anchor)
+        if code < 0:
+            return columns.steps[:0], columns.scores[:0]
+        run = slice(columns.offsets[code], columns.offsets[code + 1])
+        keep = columns.scored[run]
+        return columns.steps[run][keep], columns.scores[run][keep]
 
     def _plot_group(
         self,
         item_id: str,
         eval_dir: Path,
         key: Key,
-        series: List[Tuple[int, Dict[str, Optional[float]]]],
+        steps: np.ndarray,
+        scores: np.ndarray,
+        ax: Optional[Axes] = None,
     ) -> Optional[Path]:
-        """Plot a group of evaluation data and save as PNG."""
-        if not series:
-            return None
-        series.sort(key=lambda x: x[0])
-        steps = [s for s, _ in series]
-        # Prepare y values per criterion, keeping None as gaps
-        ys: Dict[str, List[Optional[float]]] = {
-            crit: [vals.get(crit) for _, vals in series] for crit in self.criteria
-        }
+        """Plot a group of evaluation data and save as PNG.
 
-        plt.figure(figsize=(9.5, 5.5), dpi=140)
+        ``steps`` is sorted ascending and ``scores`` holds one row per step with
+        NaN for missing criteria, as returned by :meth:`_select_series`. When
+        ``ax`` is given it is cleared and reused; otherwise a figure is created
+        and closed for this chart alone.
+        """
+        if not steps.size:
+            return None
+        present = ~np.isnan(scores)
 
-        for crit in self.criteria:
-            y = ys[crit]
-            # Plot with gaps for None
-            x_non_null = [x for x, v in zip(steps, y) if v is not None]
-            y_non_null = [float(v) for v in y if v is not None]
-            if not x_non_null:
-                continue
-            plt.plot(
-                x_non_null,
-                y_non_null,
-                marker="o",
-                linewidth=1.8,
-                label=crit.replace("_", " ").title(),
-                color=self.colors.get(crit),
-                linestyle="--",
+        plt = _pyplot()
+        own_figure = ax is None
+        if ax is None:
+            _, ax = plt.subplots(figsize=(9.5, 5.5), dpi=140)
+        else:
+            ax.clear()
+        fig = ax.figure
+
+        cols = np.flatnonzero(present.any(axis=0))
+        crits = [self.criteria[col] for col in cols]
+        style = {"marker": "o", "linewidth": 1.8, "linestyle": "--"}
+        if present[:, cols].all():
+            # No gaps: draw every criterion with a single call on the matrix.
+            lines = ax.plot(
+                steps,
+                scores[:, cols],
+                label=[crit.replace("_", " ").title() for crit in crits],
+                **style,
             )
+            for line, crit in zip(lines, crits):
+                line.set_color(self.colors.get(crit))
+        else:
+            # A criterion missing at some steps is drawn over the steps it has,
+            # so its line joins across the gap instead of breaking at the NaN.
+            for col, crit in zip(cols, crits):
+                mask = present[:, col]
+                ax.plot(
+                    steps[mask],
+                    scores[mask, col],
+                    label=crit.replace("_", " ").title(),
+                    color=self.colors.get(crit),
+                    **style,
+                )
 
         title_parts = [item_id, key.comparison_type, key.anchor]
         if key.direction:
             title_parts.append(key.direction)
-        plt.title(" | ".join(title_parts))
-        plt.xlabel("Generation (step)")
-        plt.ylabel("Score")
+        ax.set_title(" | ".join(title_parts))
+        ax.set_xlabel("Generation (step)")
+        ax.set_ylabel("Score")
 
         # Set y-axis limits based on data
-        all_vals: List[float] = []
-        for crit in self.criteria:
-            for v in ys[crit]:
-                if v is not None:
-                    all_vals.append(float(v))
-        if all_vals:
-            ymax = max(all_vals)
+        if present.any():
+            ymax = float(np.nanmax(scores))
             if ymax <= 1.0:
-                plt.ylim(0, 1.0)
+                ax.set_ylim(0, 1.0)
             elif ymax <= 10.0:
-                plt.ylim(0, 11.0)
+                ax.set_ylim(0, 11.0)
             else:
-                plt.ylim(0, ymax * 1.05)
+                ax.set_ylim(0, ymax * 1.05)
 
-        if steps:
-            min_step = min(steps)
-            max_step = max(steps)
-            plt.xticks(range(min_step, max_step + 1))
+        ax.set_xticks(range(int(steps[0]), int(steps[-1]) + 1))
 
-        plt.grid(True, linestyle=":", alpha=0.4)
-        plt.legend(loc="best", fontsize=8)
-        plt.tight_layout()
+        ax.grid(True, linestyle=":", alpha=0.4)
+        ax.legend(loc="best", fontsize=8)
+        fig.tight_layout()
 
         # File name
         base = f"chart_{key.comparison_type}_{key.anchor}"
@@ -335,8 +444,9 @@ class GraphCreator:
             base += f"_{key.direction}"
         fname = self._sanitize_filename(base) + ".png"
         out_path = eval_dir / fname
-        plt.savefig(out_path)
-        plt.close()
+        fig.savefig(out_path)
+        if own_figure:
+            plt.close(fig)
         return out_path
 
     @staticmethod
@@ -353,11 +463,17 @@ class GraphCreator:
         if candidate.is_dir():
             eval_dirs.append(candidate)
 
-        # If this is an experiment folder containing multiple items
-        for child in root.iterdir() if root.is_dir() else []:
-            c_eval = child / "eval"
-            if c_eval.is_dir():
-                eval_dirs.append(c_eval)
+        # If this is an experiment folder containing multiple items. scandir
+        # reports entry types from the directory listing itself, so plain files
+        # (metadata.json, snapshots, ...) are skipped without a stat call.
+        if root.is_dir():
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    c_eval = os.path.join(entry.path, "eval")
+                    if os.path.isdir(c_eval):
+                        eval_dirs.append(Path(c_eval))
 
         # As a last resort, deep scan (one level deeper) for any eval dirs
         if not eval_dirs and root.is_dir():
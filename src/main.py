@@ -9,6 +9,7 @@ If no flags are provided, the full pipeline runs: generation -> evaluation -> re
 """
 
 import argparse
+import json
 import os
 import sys
 from pathlib import Path
@@ -32,7 +33,12 @@ def main():
 
     try:
         config = BenchmarkConfig.from_yaml(args.config)
-    except (FileNotFoundError, yaml.YAMLError, AttributeError) as e:
+    except (
+        FileNotFoundError,
+        yaml.YAMLError,
+        json.JSONDecodeError,
+        AttributeError,
+    ) as e:
         print(f"[ERROR] Failed to load config: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -90,7 +96,9 @@ def main():
         # Charts
         if force or want_charts:
             graph_creator = GraphCreator()
-            all_charts = graph_creator.generate_charts_for_experiment(exp_root)
+            all_charts = graph_creator.generate_charts_for_experiment(
+                exp_root, max_workers=None
+            )
             total = len(all_charts)
             print(f"[INFO] Charts generated: {total}")
             ran_any = ran_any or total > 0
@@ -155,7 +163,7 @@ def parse_args():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="RaA Benchmark Runner")
     parser.add_argument(
-        "--config", "-c", type=str, required=True, help="Path to YAML config"
+        "--config", "-c", type=str, required=True, help="Path to YAML or JSON config"
     )
 
     group = parser.add_mutually_exclusive_group()
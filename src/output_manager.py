@@ -4,13 +4,14 @@ Utility for writing text, images, and metadata inside the experiment folder.
 Supports creating sub-managers rooted at results/exp_name/<image_stem>/.
 """
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List
 
 import yaml
 from PIL import Image
 
+import fast_json
+
 
 class OutputManager:
     """Utility for writing text, images, and metadata inside the experiment folder."""
@@ -38,8 +39,7 @@ class OutputManager:
         self, obj: Dict[str, Any] | List[Any], fname: str = "metadata.json"
     ) -> None:
         """Save a dictionary or list to a JSON file."""
-        with open(self._full(fname), "w", encoding="utf-8") as f:
-            json.dump(obj, f, indent=2)
+        self._full(fname).write_bytes(fast_json.dumps(obj, indent=True))
 
     def save_yaml(self, data: Dict[str, Any], fname: str) -> None:
         """Save a dictionary to a YAML file."""
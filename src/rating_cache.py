@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Content-addressed on-disk cache for rater results.
+
+A rating depends only on the comparison kind, the model, the prompts, and the
+bytes of the two compared files, so it is stored under a SHA-256 of exactly
+those. Reruns of an evaluation, and comparisons whose inputs are byte-identical
+to earlier ones, are then answered from disk instead of calling the model.
+Each entry is a small JSON file, written atomically, so concurrent workers can
+share one cache directory.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import fast_json
+
+
+class RatingCache:
+    """Store ratings under ``root`` keyed by comparison content."""
+
+    def __init__(self, root: str | Path, salt: str = "") -> None:
+        # ``salt`` is mixed into every key: anything whose change should
+        # invalidate earlier ratings (model name, prompt texts) belongs in it.
+        self.root = Path(root)
+        self.salt = salt
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def _digest(self, path: str) -> str:
+        """SHA-256 of a file, memoised on (path, mtime, size).
+
+        Text is sent to the rater stripped, so ``.txt`` files are hashed
+        without leading and trailing whitespace: captions that differ only
+        there (a trailing newline, say) share one rating.
+        """
+        st = os.stat(path)
+        memo_key = (path, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            digest = self._digests.get(memo_key)
+        if digest is None:
+            h = hashlib.sha256()
+            with open(path, "rb") as f:
+                if path.endswith(".txt"):
+                    h.update(f.read().strip())
+                else:
+                    # Images can be large; hash them without holding a copy.
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        h.update(block)
+            digest = h.hexdigest()
+            with self._lock:
+                self._digests[memo_key] = digest
+        return digest
+
+    def key(self, kind: str, a: str, b: str) -> Optional[str]:
+        """Return the cache key for a comparison, or None if a file is unreadable."""
+        try:
+            parts = [self.salt, kind, self._digest(a), self._digest(b)]
+        except OSError:
+            return None
+        return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return fast_json.loads(self._path(key).read_bytes())
+        except (OSError, fast_json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, rating: Dict[str, Any]) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(rating), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[WARN] Could not write rating cache entry {path}: {e}")
@@ -14,6 +14,8 @@ from dotenv import load_dotenv
 from google import genai
 from google.genai import types
 
+import fast_json
+
 load_dotenv()
 
 
@@ -117,8 +119,7 @@ class SummaryGenerator:
     @staticmethod
     def _load_json_file(file_path: Path) -> dict:
         """Load a JSON file and return its content."""
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return fast_json.loads(Path(file_path).read_bytes())
 
     def _load_individual_eval_files(self, eval_dir: Path) -> List[dict]:
         """Load all JSON files in the directory and return as individual dictionaries."""
@@ -200,10 +201,14 @@ class SummaryGenerator:
             eval_dirs.append(candidate)
 
         # If this is an experiment folder containing multiple items
-        for child in root.iterdir() if root.is_dir() else []:
-            c_eval = child / "eval"
-            if c_eval.is_dir():
-                eval_dirs.append(c_eval)
+        if root.is_dir():
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    c_eval = os.path.join(entry.path, "eval")
+                    if os.path.isdir(c_eval):
+                        eval_dirs.append(Path(c_eval))
 
         # As a last resort, deep scan (one level deeper) for any eval dirs
         if not eval_dirs and root.is_dir():
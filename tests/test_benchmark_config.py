@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import json
+
 import pytest
+import yaml
 
+import benchmark_config
 from benchmark_config import BenchmarkConfig
 
 VALID_YAML = """
@@ -84,6 +88,10 @@ def test_minimal_config_loads(tmp_path):
     assert cfg.loop.num_iterations == 1
     assert cfg.logging.level == "INFO"
     assert cfg.evaluation.enabled is True
+    assert cfg.evaluation.max_concurrency == 16
+    assert cfg.evaluation.rpm == 0
+    assert cfg.evaluation.max_image_side == 1024
+    assert cfg.evaluation.model == "gemini-2.5-flash-lite"
     # Default reporting values when not specified should be True
     assert cfg.reporting.charts is True  # Default is True according to _load_reporting_config
     assert cfg.reporting.summary is True  # Default is True according to _load_reporting_config
@@ -113,6 +121,14 @@ def test_malformed_output_template(tmp_path):
         BenchmarkConfig.from_yaml(str(path))
 
 
+def test_output_template_placeholders():
+    fmt = BenchmarkConfig._format_output_dir
+    assert fmt("results/{{experiment_name}}", "exp") == "results/exp"
+    assert fmt("results/{experiment_name}/run", "exp") == "results/exp/run"
+    with pytest.raises(ValueError):
+        fmt("results/{unknown}", "exp")
+
+
 def test_zero_iterations_raises(tmp_path):
     bad_yaml = VALID_YAML.replace("num_iterations: 3", "num_iterations: 0")
     path = tmp_path / "zero.yaml"
@@ -127,3 +143,70 @@ def test_negative_iterations_raises(tmp_path):
     path.write_text(bad_yaml)
     with pytest.raises(ValueError):
         BenchmarkConfig.from_yaml(str(path))
+
+
+def test_zero_max_concurrency_raises(tmp_path):
+    bad_yaml = VALID_YAML.replace("enabled: true", "enabled: true\n  max_concurrency: 0")
+    path = tmp_path / "zero_concurrency.yaml"
+    path.write_text(bad_yaml)
+    with pytest.raises(ValueError):
+        BenchmarkConfig.from_yaml(str(path))
+
+
+def test_quoted_batch_mode_raises(tmp_path):
+    bad_yaml = VALID_YAML.replace("enabled: true", 'enabled: true\n  batch_mode: "false"')
+    path = tmp_path / "quoted_batch_mode.yaml"
+    path.write_text(bad_yaml)
+    with pytest.raises(ValueError):
+        BenchmarkConfig.from_yaml(str(path))
+
+
+def test_quoted_cache_flag_raises(tmp_path):
+    bad_yaml = VALID_YAML.replace("enabled: true", 'enabled: true\n  cache: "no"')
+    path = tmp_path / "quoted_cache.yaml"
+    path.write_text(bad_yaml)
+    with pytest.raises(ValueError):
+        BenchmarkConfig.from_yaml(str(path))
+
+
+def test_json_config_matches_yaml(tmp_path, valid_cfg_file):
+    raw = yaml.safe_load(VALID_YAML)
+    json_path = tmp_path / "cfg.json"
+    json_path.write_text(json.dumps(raw))
+
+    assert BenchmarkConfig.from_yaml(str(json_path)) == BenchmarkConfig.from_yaml(
+        valid_cfg_file
+    )
+
+
+def test_empty_config_file_reports_missing_keys(tmp_path):
+    path = tmp_path / "empty.yaml"
+    path.write_text("")
+    with pytest.raises(KeyError):
+        BenchmarkConfig.from_yaml(str(path))
+
+
+def test_from_yaml_caches_until_file_changes(valid_cfg_file):
+    first = BenchmarkConfig.from_yaml(valid_cfg_file)
+    assert BenchmarkConfig.from_yaml(valid_cfg_file) is first
+
+    with open(valid_cfg_file, "a", encoding="utf-8") as f:
+        f.write("\n# touched\n")
+    reloaded = BenchmarkConfig.from_yaml(valid_cfg_file)
+    assert reloaded is not first
+    assert reloaded == first
+
+
+def test_slow_yaml_loader_warns_once_on_first_parse(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(benchmark_config, "_SafeLoader", yaml.SafeLoader)
+    benchmark_config._warn_if_slow_yaml_loader.cache_clear()
+    for name in ("a.yaml", "b.yaml"):
+        path = tmp_path / name
+        path.write_text(VALID_YAML)
+        BenchmarkConfig.from_yaml(str(path))
+    benchmark_config._warn_if_slow_yaml_loader.cache_clear()
+
+    warnings = [r for r in caplog.records if "libyaml" in r.getMessage()]
+    assert len(warnings) == 1
+    assert warnings[0].levelname == "WARNING"
+    assert warnings[0].name == "benchmark_config"
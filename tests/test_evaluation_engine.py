@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
+import io
 import json
+import threading
+import time
+from types import SimpleNamespace
 
 import evaluation_engine
 from evaluation_engine import EvaluationEngine
@@ -167,3 +171,399 @@ def test_run_rater_uses_structured_output(monkeypatch, tmp_path):
     }
 
     assert rating == expected_output
+
+
+def test_batch_mode_rates_all_items_in_one_job(tmp_path, monkeypatch):
+    exp = tmp_path / "exp"
+    for item_id in ("item1", "item2"):
+        (exp / item_id).mkdir(parents=True)
+    meta = {
+        item_id: {
+            "input": "input.jpg",
+            "iter1_img": "image_iter1.jpg",
+            "iter1_text": "text_iter1.txt",
+            "iter2_img": "image_iter2.jpg",
+            "iter2_text": "text_iter2.txt",
+        }
+        for item_id in ("item1", "item2")
+    }
+    (exp / "metadata.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    monkeypatch.setattr(
+        EvaluationEngine, "_prepare_contents", lambda self, kind, a, b: [kind, a, b]
+    )
+    monkeypatch.setattr(evaluation_engine.time, "sleep", lambda _s: None)
+
+    rating_json = json.dumps(
+        {
+            crit: {"score": 7.5, "reason": "batch"}
+            for crit in evaluation_engine.DEFAULT_RATING
+        }
+    )
+
+    class DummyBatches:
+        def __init__(self):
+            self.created = []
+
+        def create(self, model, src, config):
+            self.created.append(src)
+            return SimpleNamespace(name="batches/1", state="JOB_STATE_PENDING")
+
+        def get(self, name):
+            responses = [
+                SimpleNamespace(error=None, response=SimpleNamespace(text=rating_json))
+                for _ in self.created[0]
+            ]
+            return SimpleNamespace(
+                name=name,
+                state=evaluation_engine.types.JobState.JOB_STATE_SUCCEEDED,
+                dest=SimpleNamespace(inlined_responses=responses),
+            )
+
+    client = SimpleNamespace(batches=DummyBatches())
+    config = BenchmarkConfig(
+        experiment_name="test",
+        input_dir="test",
+        loop=_LoopConfig(type="I-T-I", num_iterations=2),
+        evaluation=_EvaluationConfig(enabled=True, batch_mode=True),
+    )
+    EvaluationEngine(str(exp), config=config, client=client).run()
+
+    assert len(client.batches.created) == 1
+    assert len(client.batches.created[0]) == 2 * (3 + 1 + 5 + 1)
+    for item_id in ("item1", "item2"):
+        img_txt = json.loads(
+            (exp / item_id / "eval" / "ratings_image-text.json").read_text()
+        )
+        assert len(img_txt) == 5
+        assert all(r["item_id"] == item_id for r in img_txt)
+        assert img_txt[0]["overall_semantic_intent"]["score"] == 7.5
+
+
+def test_rater_calls_run_concurrently(tmp_path, monkeypatch):
+    exp = tmp_path / "exp"
+    (exp / "item1").mkdir(parents=True)
+    meta = {"item1": {"iter1_img": "image_iter1.jpg", "iter1_text": "text_iter1.txt"}}
+    (exp / "metadata.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    # I-T-I with one iteration plans three comparisons; each waits for the
+    # others, so this only finishes if they are all in flight at once.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def rater(self, kind, a, b):
+        barrier.wait()
+        return evaluation_engine.DEFAULT_RATING
+
+    monkeypatch.setattr(EvaluationEngine, "_run_rater", rater)
+    EvaluationEngine(str(exp), config=create_mock_config(), client=None).run()
+
+    ratings = json.loads(
+        (exp / "item1" / "eval" / "ratings_image-text.json").read_text()
+    )
+    assert [r["anchor"] for r in ratings] == ["original", "same-step"]
+
+
+def test_rerun_reuses_cached_ratings(tmp_path, monkeypatch):
+    exp = tmp_path / "exp"
+    item = exp / "item1"
+    item.mkdir(parents=True)
+    meta = {"item1": {"iter1_img": "image_iter1.jpg", "iter1_text": "text_iter1.txt"}}
+    (exp / "metadata.json").write_text(json.dumps(meta), encoding="utf-8")
+    (item / "input.jpg").write_text("x", encoding="utf-8")
+    (item / "image_iter1.jpg").write_text("y", encoding="utf-8")
+    (item / "text_iter1.txt").write_text("z", encoding="utf-8")
+
+    calls = []
+
+    def rater(self, kind, a, b):
+        calls.append(kind)
+        return {"overall_semantic_intent": {"score": 6.0, "reason": "cached"}}
+
+    monkeypatch.setattr(EvaluationEngine, "_run_rater", rater)
+    for _ in range(2):
+        EvaluationEngine(str(exp), config=create_mock_config(), client=object()).run()
+
+    assert len(calls) == 3
+    ratings = json.loads((item / "eval" / "ratings_image-image.json").read_text())
+    assert ratings[0]["overall_semantic_intent"]["score"] == 6.0
+
+
+def test_image_part_downscales_and_caches(tmp_path):
+    big = tmp_path / "big.png"
+    evaluation_engine.Image.new("L", (2048, 1024), color=128).save(big)
+    small = tmp_path / "small.jpg"
+    evaluation_engine.Image.new("RGB", (64, 64), color=(1, 2, 3)).save(small)
+    evaluation_engine._encode_image.cache_clear()
+    engine = EvaluationEngine(str(tmp_path), config=create_mock_config())
+
+    part = engine._image_part(str(big))
+    assert part.inline_data.mime_type == "image/jpeg"
+    with evaluation_engine.Image.open(io.BytesIO(part.inline_data.data)) as img:
+        assert img.mode == "RGB"
+        assert img.size == (1024, 512)
+
+    # Small RGB JPEGs are sent byte-for-byte.
+    assert engine._image_part(str(small)).inline_data.data == small.read_bytes()
+
+    engine._image_part(str(big))
+    assert evaluation_engine._encode_image.cache_info().misses == 2
+
+
+def test_max_image_side_limits_upload_size(tmp_path):
+    big = tmp_path / "big.png"
+    evaluation_engine.Image.new("RGB", (2048, 1024)).save(big)
+    config = BenchmarkConfig(
+        experiment_name="test",
+        input_dir="test",
+        loop=_LoopConfig(type="I-T-I", num_iterations=1),
+        evaluation=_EvaluationConfig(enabled=True, max_image_side=512),
+    )
+    engine = EvaluationEngine(str(tmp_path), config=config)
+
+    part = engine._image_part(str(big))
+    with evaluation_engine.Image.open(io.BytesIO(part.inline_data.data)) as img:
+        assert img.size == (512, 256)
+    # Ratings of downscaled images are cached apart from full-size ones.
+    default = EvaluationEngine(str(tmp_path), config=create_mock_config())
+    assert engine.cache.salt != default.cache.salt
+
+
+def test_concurrent_image_parts_encode_once(tmp_path, monkeypatch):
+    img = tmp_path / "a.png"
+    evaluation_engine.Image.new("RGB", (8, 8)).save(img)
+    engine = EvaluationEngine(str(tmp_path), config=create_mock_config())
+    calls = []
+    start = threading.Barrier(4)
+
+    def slow_encode(path, mtime_ns, size, max_side):
+        calls.append(path)
+        time.sleep(0.2)
+        return b"jpeg"
+
+    def worker():
+        start.wait()
+        engine._image_part(str(img))
+
+    monkeypatch.setattr(evaluation_engine, "_encode_image", slow_encode)
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert engine._encodes == {}
+
+
+def test_read_text_memoises_per_file_version(tmp_path):
+    path = tmp_path / "caption.txt"
+    path.write_text("  a caption \n", encoding="utf-8")
+    engine = EvaluationEngine(str(tmp_path), config=create_mock_config())
+
+    assert engine._read_text(str(path)) == "a caption"
+    hits = evaluation_engine._read_text_cached.cache_info().hits
+    assert engine._read_text(str(path)) == "a caption"
+    assert evaluation_engine._read_text_cached.cache_info().hits == hits + 1
+    assert engine._read_text(str(tmp_path / "none.txt")) == "No text available"
+
+    # Listings are taken once per run; a fresh engine sees the new caption.
+    path.write_text("a longer caption", encoding="utf-8")
+    engine = EvaluationEngine(str(tmp_path), config=create_mock_config())
+    assert engine._read_text(str(path)) == "a longer caption"
+
+
+def test_pack_size_rates_same_kind_pairs_together(tmp_path, monkeypatch):
+    exp = tmp_path / "exp"
+    (exp / "item1").mkdir(parents=True)
+    meta = {
+        "item1": {
+            "iter1_img": "image_iter1.jpg",
+            "iter1_text": "text_iter1.txt",
+            "iter2_img": "image_iter2.jpg",
+            "iter2_text": "text_iter2.txt",
+        }
+    }
+    (exp / "metadata.json").write_text(json.dumps(meta), encoding="utf-8")
+    monkeypatch.setattr(
+        EvaluationEngine, "_prepare_contents", lambda self, kind, a, b: [kind, a, b]
+    )
+
+    rating = {
+        crit: {"score": 9.0, "reason": "packed"}
+        for crit in evaluation_engine.DEFAULT_RATING
+    }
+    pack_sizes = []
+
+    class DummyModels:
+        def generate_content(self, model, config, contents):
+            pairs = sum(1 for c in contents if str(c).startswith("PAIR "))
+            pack_sizes.append(pairs)
+            if pairs:
+                return SimpleNamespace(parsed=[rating] * pairs)
+            return SimpleNamespace(parsed=rating)
+
+    config = BenchmarkConfig(
+        experiment_name="test",
+        input_dir="test",
+        loop=_LoopConfig(type="I-T-I", num_iterations=2),
+        evaluation=_EvaluationConfig(enabled=True, pack_size=4),
+    )
+    client = SimpleNamespace(models=DummyModels())
+    EvaluationEngine(str(exp), config=config, client=client).run()
+
+    # image-image 3 -> one pack; image-text 5 -> a pack of 4 plus a single call;
+    # text-text 1 and text-image 1 -> single calls.
+    assert sorted(pack_sizes) == [0, 0, 0, 3, 4]
+    img_txt = json.loads(
+        (exp / "item1" / "eval" / "ratings_image-text.json").read_text()
+    )
+    assert len(img_txt) == 5
+    assert all(r["overall_semantic_intent"]["reason"] == "packed" for r in img_txt)
+
+
+def test_parsed_rating_validates_raw_text_when_not_preparsed():
+    crit = {"score": 3, "reason": "ok"}
+    text = json.dumps({k: crit for k in evaluation_engine._RatingModel.model_fields})
+
+    rating = EvaluationEngine._parsed_rating(SimpleNamespace(parsed=None, text=text))
+
+    assert rating["overall_semantic_intent"] == {"score": 3.0, "reason": "ok"}
+    bad = SimpleNamespace(parsed=None, text='Sure! {"score": 3}')
+    assert EvaluationEngine._parsed_rating(bad) is None
+
+
+def test_scores_outside_rubric_scale_are_rejected():
+    crit = {"score": 42, "reason": "off the scale"}
+    text = json.dumps({k: crit for k in evaluation_engine._RatingModel.model_fields})
+
+    response = SimpleNamespace(parsed=None, text=text)
+    assert EvaluationEngine._parsed_rating(response) is None
+
+
+def test_prompts_are_read_once_per_process(tmp_path):
+    config = create_mock_config()
+    first = EvaluationEngine(str(tmp_path), config=config)
+    second = EvaluationEngine(str(tmp_path), config=config)
+
+    assert first.prompts is second.prompts
+    assert "text_text_prompt" in first.prompts
+
+
+def test_identical_comparisons_are_rated_once_per_pass(tmp_path, monkeypatch):
+    exp = tmp_path / "exp"
+    item = exp / "item1"
+    item.mkdir(parents=True)
+    meta = {
+        "item1": {
+            "iter1_img": "image_iter1.jpg",
+            "iter1_text": "text_iter1.txt",
+            "iter2_img": "image_iter2.jpg",
+            "iter2_text": "text_iter2.txt",
+        }
+    }
+    (exp / "metadata.json").write_text(json.dumps(meta), encoding="utf-8")
+    (item / "input.jpg").write_text("x", encoding="utf-8")
+    # The second iteration reproduced the first byte for byte.
+    for step in (1, 2):
+        (item / f"image_iter{step}.jpg").write_text("y", encoding="utf-8")
+        (item / f"text_iter{step}.txt").write_text("z", encoding="utf-8")
+
+    calls = []
+
+    def rater(self, kind, a, b):
+        calls.append((kind, open(a).read(), open(b).read()))
+        return {"overall_semantic_intent": {"score": 6.0, "reason": kind}}
+
+    monkeypatch.setattr(EvaluationEngine, "_run_rater", rater)
+    EvaluationEngine(str(exp), config=create_mock_config(), client=object()).run()
+
+    assert len(calls) == len(set(calls))
+    img_txt = json.loads((item / "eval" / "ratings_image-text.json").read_text())
+    assert len(img_txt) == 5
+    assert all(r["overall_semantic_intent"]["score"] == 6.0 for r in img_txt)
+
+
+def test_evaluation_model_override_is_used(tmp_path, monkeypatch):
+    seen = []
+
+    class Models:
+        def generate_content(self, model, config, contents):
+            seen.append(model)
+            return SimpleNamespace(parsed=evaluation_engine.DEFAULT_RATING)
+
+    monkeypatch.setattr(
+        EvaluationEngine, "_prepare_contents", lambda self, kind, a, b: [kind]
+    )
+    config = BenchmarkConfig(
+        experiment_name="test",
+        input_dir="test",
+        loop=_LoopConfig(type="I-T-I", num_iterations=1),
+        evaluation=_EvaluationConfig(enabled=True, model="gemini-2.5-pro"),
+    )
+    engine = EvaluationEngine(
+        str(tmp_path), config=config, client=SimpleNamespace(models=Models())
+    )
+
+    engine._run_rater("text-text", "a.txt", "b.txt")
+    assert seen == ["gemini-2.5-pro"]
+    assert "gemini-2.5-pro" in engine.cache.salt
+
+
+def test_identical_comparisons_across_items_are_rated_once(tmp_path, monkeypatch):
+    exp = tmp_path / "exp"
+    meta = {}
+    for item_id in ("item1", "item2"):
+        item = exp / item_id
+        item.mkdir(parents=True)
+        meta[item_id] = {"iter1_img": "image_iter1.jpg", "iter1_text": "text_iter1.txt"}
+        # Both items start from the same input and produce the same outputs.
+        (item / "input.jpg").write_text("x", encoding="utf-8")
+        (item / "image_iter1.jpg").write_text("y", encoding="utf-8")
+        (item / "text_iter1.txt").write_text("z", encoding="utf-8")
+    (exp / "metadata.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    calls = []
+
+    def rater(self, kind, a, b):
+        calls.append(kind)
+        return {"overall_semantic_intent": {"score": 6.0, "reason": kind}}
+
+    monkeypatch.setattr(EvaluationEngine, "_run_rater", rater)
+    EvaluationEngine(str(exp), config=create_mock_config(), client=object()).run()
+
+    assert len(calls) == 3
+    for item_id in ("item1", "item2"):
+        ratings = json.loads(
+            (exp / item_id / "eval" / "ratings_image-text.json").read_text()
+        )
+        assert [r["item_id"] for r in ratings] == [item_id, item_id]
+        assert ratings[0]["overall_semantic_intent"]["score"] == 6.0
+
+
+def test_items_are_written_without_waiting_for_earlier_items(tmp_path, monkeypatch):
+    exp = tmp_path / "exp"
+    meta = {}
+    for item_id in ("slow", "fast"):
+        item = exp / item_id
+        item.mkdir(parents=True)
+        meta[item_id] = {"iter1_img": "image_iter1.jpg", "iter1_text": "text_iter1.txt"}
+        (item / "input.jpg").write_text(item_id, encoding="utf-8")
+        (item / "image_iter1.jpg").write_text(item_id, encoding="utf-8")
+        (item / "text_iter1.txt").write_text(item_id, encoding="utf-8")
+    (exp / "metadata.json").write_text(json.dumps(meta), encoding="utf-8")
+    fast_written = exp / "fast" / "eval" / "ratings_image-text.json"
+    seen_before_slow_finished = []
+
+    def rater(self, kind, a, b):
+        if "slow" in a:
+            deadline = time.monotonic() + 5
+            while not fast_written.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            seen_before_slow_finished.append(fast_written.exists())
+        return {"overall_semantic_intent": {"score": 6.0, "reason": kind}}
+
+    monkeypatch.setattr(EvaluationEngine, "_run_rater", rater)
+    EvaluationEngine(str(exp), config=create_mock_config(), client=object()).run()
+
+    assert seen_before_slow_finished and all(seen_before_slow_finished)
+    assert (exp / "slow" / "eval" / "ratings_image-text.json").exists()
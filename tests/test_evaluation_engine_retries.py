@@ -3,8 +3,9 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from google.genai.errors import ClientError
 
-from src.benchmark_config import BenchmarkConfig
+from src.benchmark_config import BenchmarkConfig, _EvaluationConfig
 from src.evaluation_engine import DEFAULT_RATING, EvaluationEngine
 
 
@@ -17,6 +18,7 @@ def engine():
     # Create the main config mock and set up the loop attribute
     mock_config = Mock(spec=BenchmarkConfig)
     mock_config.loop = mock_loop
+    mock_config.evaluation = _EvaluationConfig(enabled=True)
 
     # Create a properly structured client mock
     mock_client = Mock()
@@ -49,9 +51,10 @@ def test_successful_retry_after_failure(engine):
     assert engine.client.models.generate_content.call_count == 3
     # Verify we got actual data instead of DEFAULT_RATING
     assert rating == {"some": "data"}
-    # Verify sleep was called with exponential backoff
-    mock_sleep.assert_any_call(1)  # First retry
-    mock_sleep.assert_any_call(2)  # Second retry
+    # Verify sleep was called with jittered exponential backoff
+    first, second = [call.args[0] for call in mock_sleep.call_args_list]
+    assert 0.5 <= first <= 1.5  # First retry: 1s +/- 50%
+    assert 1.0 <= second <= 3.0  # Second retry: 2s +/- 50%
 
 
 def test_exceeds_max_retries(engine):
@@ -105,5 +108,67 @@ def test_backoff_timing(engine):
     with patch("time.sleep", side_effect=mock_sleep):
         engine._run_rater("image-image", "test_a.jpg", "test_b.jpg")
 
-    # Verify total time waited matches expected backoff (1 + 2 = 3 seconds)
-    assert current_time == 3
+    # Verify total time waited matches expected backoff (1 + 2 = 3 seconds,
+    # each delay jittered by up to 50%)
+    assert 1.5 <= current_time <= 4.5
+
+
+def test_rejected_request_is_not_retried(engine):
+    """Errors the API will repeat, such as a bad request, fail fast."""
+    engine.client.models.generate_content.side_effect = ClientError(
+        400, {"error": {"message": "bad request"}}
+    )
+
+    with (
+        patch.object(engine, "_prepare_contents", return_value=["mock_content"]),
+        patch("time.sleep") as mock_sleep,
+    ):
+        rating = engine._run_rater("image-image", "test_a.jpg", "test_b.jpg")
+
+    assert engine.client.models.generate_content.call_count == 1
+    mock_sleep.assert_not_called()
+    assert rating == DEFAULT_RATING
+
+
+def test_rate_limit_is_retried(engine):
+    """429 responses are transient and retried with backoff."""
+    mock_response = Mock()
+    mock_response.parsed = {"some": "data"}
+    engine.client.models.generate_content.side_effect = [
+        ClientError(429, {"error": {"message": "quota"}}),
+        mock_response,
+    ]
+
+    with (
+        patch.object(engine, "_prepare_contents", return_value=["mock_content"]),
+        patch("time.sleep"),
+    ):
+        rating = engine._run_rater("image-image", "test_a.jpg", "test_b.jpg")
+
+    assert engine.client.models.generate_content.call_count == 2
+    assert rating == {"some": "data"}
+
+
+def test_rate_limit_waits_for_server_retry_delay(engine):
+    """A RetryInfo hint on a 429 replaces the default backoff."""
+    retry_info = {
+        "@type": "type.googleapis.com/google.rpc.RetryInfo",
+        "retryDelay": "7s",
+    }
+    mock_response = Mock()
+    mock_response.parsed = {"some": "data"}
+    engine.client.models.generate_content.side_effect = [
+        ClientError(429, {"error": {"message": "quota", "details": [retry_info]}}),
+        mock_response,
+    ]
+
+    with (
+        patch.object(engine, "_prepare_contents", return_value=["mock_content"]),
+        patch("time.sleep") as mock_sleep,
+    ):
+        rating = engine._run_rater("image-image", "test_a.jpg", "test_b.jpg")
+
+    # The hinted 7s, plus up to 20% jitter so workers do not wake together
+    mock_sleep.assert_called_once()
+    assert 7.0 <= mock_sleep.call_args.args[0] <= 8.4
+    assert rating == {"some": "data"}
@@ -8,6 +8,7 @@ that generates evaluation score visualizations from ratings JSON files.
 """
 
 import json
+import math
 from unittest.mock import patch
 
 from src.graph_creator import (
@@ -116,6 +117,13 @@ class TestGraphCreator:
         assert len(records) == 2
         assert all(isinstance(r, dict) for r in records)
 
+    def test_load_records_skips_malformed_file(self, tmp_path):
+        eval_dir = self.create_test_eval_dir_with_data(tmp_path)
+        (eval_dir / "ratings_text-text.json").write_bytes(b"[{not json")
+        creator = GraphCreator()
+        records = creator._load_records(eval_dir)
+        assert len(records) == 2
+
     def test_extract_item_id(self, tmp_path):
         eval_dir = self.create_test_eval_dir_with_data(tmp_path)
         creator = GraphCreator()
@@ -130,19 +138,55 @@ class TestGraphCreator:
         item_id = creator._extract_item_id(eval_dir, [])
         assert item_id == "test_item"
 
-    def test_iter_series(self, tmp_path):
+    def test_select_series(self, tmp_path):
         eval_dir = self.create_test_eval_dir_with_data(tmp_path)
         creator = GraphCreator()
         records = creator._load_records(eval_dir)
         key = Key("image-image", "original")
 
-        series = list(creator._iter_series(records, key))
-        assert len(series) == 2
+        steps, scores = creator._select_series(creator._to_columns(records), key)
+        assert len(steps) == 2
+
+        assert steps[0] == 1
+        assert scores[0, CRITERIA.index("content_correspondence")] == 0.8
+
+    def test_select_series_orders_steps_and_drops_placeholders(self):
+        creator = GraphCreator()
+        records = [
+            {
+                "comparison_type": "text-text",
+                "anchor": "previous",
+                "step": 3,
+                "content_correspondence": {"score": 6.0},
+            },
+            {
+                "comparison_type": "text-text",
+                "anchor": "previous",
+                "step": 2,
+                "content_correspondence": {"score": -1.0},
+                "stylistic_congruence": {"score": 4.0},
+            },
+            {
+                "comparison_type": "text-text",
+                "anchor": "previous",
+                "step": 4,
+                "content_correspondence": {"score": -1.0},
+            },
+            {
+                "comparison_type": "image-image",
+                "anchor": "previous",
+                "step": 1,
+                "content_correspondence": {"score": 9.0},
+            },
+        ]
+        columns = creator._to_columns(records)
+        steps, scores = creator._select_series(columns, Key("text-text", "previous"))
 
-        step, scores = series[0]
-        assert step == 1
-        assert "content_correspondence" in scores
-        assert scores["content_correspondence"] == 0.8
+        assert steps.tolist() == [2, 3]
+        assert scores.shape == (2, len(CRITERIA))
+        assert math.isnan(scores[0, CRITERIA.index("content_correspondence")])
+        assert scores[0, CRITERIA.index("stylistic_congruence")] == 4.0
+        assert scores[1, CRITERIA.index("content_correspondence")] == 6.0
 
     def test_get_wanted_keys_iti(self):
         creator = GraphCreator()
@@ -244,6 +288,39 @@ class TestGraphCreator:
             # Should process both directories
             assert mock_plot.call_count >= 2
 
+    def test_generate_charts_for_experiment_in_parallel(self, tmp_path):
+        for item in ("item1", "item2"):
+            self.create_test_eval_dir_with_data(tmp_path / item)
+
+        creator = GraphCreator()
+        charts = creator.generate_charts_for_experiment(tmp_path, max_workers=2)
+
+        assert {p.parent.parent.name for p in charts} == {"item1"}
+        assert {p.parent.parent.parent.name for p in charts} == {"item1", "item2"}
+        assert all(p.is_file() for p in charts)
+
+    def test_generate_charts_for_experiment_caps_workers(self, tmp_path):
+        for item in ("item1", "item2"):
+            self.create_test_eval_dir_with_data(tmp_path / item)
+        creator = GraphCreator()
+
+        with (
+            patch("src.graph_creator.os.cpu_count", return_value=8),
+            patch("src.graph_creator.ProcessPoolExecutor") as mock_pool,
+        ):
+            mock_pool.return_value.__enter__.return_value.map.return_value = [[], []]
+            creator.generate_charts_for_experiment(tmp_path, max_workers=None)
+        mock_pool.assert_called_once_with(max_workers=2)
+
+    def test_generate_charts_for_single_item_renders_serially(self, tmp_path):
+        self.create_test_eval_dir_with_data(tmp_path / "item1")
+        creator = GraphCreator()
+
+        with patch("src.graph_creator.ProcessPoolExecutor") as mock_pool:
+            charts = creator.generate_charts_for_experiment(tmp_path, max_workers=None)
+        mock_pool.assert_not_called()
+        assert charts and all(p.is_file() for p in charts)
+
 
 class TestCriteria:
     """Test that CRITERIA constant is properly defined."""
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+from rating_cache import RatingCache
+
+RATING = {"overall_semantic_intent": {"score": 8.0, "reason": "close"}}
+
+
+def test_put_then_get_round_trips(tmp_path):
+    a = tmp_path / "a.txt"
+    b = tmp_path / "b.txt"
+    a.write_text("A")
+    b.write_text("B")
+    cache = RatingCache(tmp_path / "cache", salt="model")
+
+    key = cache.key("text-text", str(a), str(b))
+    assert cache.get(key) is None
+    cache.put(key, RATING)
+    assert cache.get(key) == RATING
+    # A fresh instance over the same directory sees the stored rating.
+    assert RatingCache(tmp_path / "cache", salt="model").get(key) == RATING
+
+
+def test_key_follows_content_not_path(tmp_path):
+    a = tmp_path / "a.txt"
+    b = tmp_path / "b.txt"
+    copy = tmp_path / "copy_of_a.txt"
+    a.write_text("same")
+    copy.write_text("same")
+    b.write_text("other")
+    cache = RatingCache(tmp_path / "cache")
+
+    assert cache.key("text-text", str(a), str(b)) == cache.key(
+        "text-text", str(copy), str(b)
+    )
+    assert cache.key("text-text", str(a), str(b)) != cache.key(
+        "text-text", str(b), str(a)
+    )
+    assert cache.key("text-text", str(a), str(b)) != cache.key(
+        "image-text", str(a), str(b)
+    )
+    assert cache.key("text-text", str(a), str(b)) != RatingCache(
+        tmp_path / "cache", salt="other-model"
+    ).key("text-text", str(a), str(b))
+
+
+def test_text_key_ignores_surrounding_whitespace(tmp_path):
+    a = tmp_path / "a.txt"
+    a_newline = tmp_path / "a_newline.txt"
+    a_spaced = tmp_path / "a_spaced.txt"
+    b = tmp_path / "b.txt"
+    a.write_text("a cat")
+    a_newline.write_text("a cat\n")
+    a_spaced.write_text("a  cat")
+    b.write_text("B")
+    cache = RatingCache(tmp_path / "cache")
+
+    key = cache.key("text-text", str(a), str(b))
+    assert key == cache.key("text-text", str(a_newline), str(b))
+    assert key != cache.key("text-text", str(a_spaced), str(b))
+
+
+def test_missing_file_has_no_key(tmp_path):
+    a = tmp_path / "a.txt"
+    a.write_text("A")
+    cache = RatingCache(tmp_path / "cache")
+    assert cache.key("text-text", str(a), str(tmp_path / "missing.txt")) is None
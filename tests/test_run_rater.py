@@ -1,13 +1,14 @@
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 from evaluation_engine import EvaluationEngine, DEFAULT_RATING
-from benchmark_config import BenchmarkConfig
+from benchmark_config import BenchmarkConfig, _EvaluationConfig
 
 
 def create_mock_config():
     """Create a mock that satisfies the BenchmarkConfig interface."""
     mock_config = MagicMock(spec=BenchmarkConfig)
     mock_config.loop = MagicMock(type="I-T-I")
+    mock_config.evaluation = _EvaluationConfig(enabled=True)
     return mock_config
 
 